@@ -0,0 +1,288 @@
+# !/usr/bin/env python
+# ----------------------------------------------------------------------
+# qwiic_eeprom_benchmark.py
+#
+# Benchmarks the QwiicEEPROM hot paths against a simulated EEPROM bus and
+# compares the results with a stored baseline
+# ----------------------------------------------------------------------
+#
+# This python library supports the SparkFun Electronics qwiic sensor/
+# board ecosystem on a Raspberry Pi (and compatable) single board
+# computers.
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun by buying a board!
+#
+# ======================================================================
+# Copyright (c) 2021 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#=======================================================================
+#
+# Every benchmark runs against qwiic_eeprom_sim.SimulatedEEPROMDriver and reports:
+#   transactions  data transfers on the bus (ACK-polls are counted as polls)
+#   wire_bytes    bytes clocked on the bus by data transfers, I2C address bytes included
+#   wall_s        wall clock time
+#   bus_s         time the transfers take at the bus clock
+#   overhead_us_per_byte
+#                 wall time not spent on the bus, per payload byte: the cost
+#                 of the library itself. Only measured by benchmarks without
+#                 write cycles, as waiting one out is mostly sleep and poll
+#                 timing, not library time
+#
+# Usage:
+#   python benchmarks/qwiic_eeprom_benchmark.py                 compare with baseline.json
+#   python benchmarks/qwiic_eeprom_benchmark.py --clock 100000 --twr 3
+#   python benchmarks/qwiic_eeprom_benchmark.py --save-baseline
+#   python benchmarks/qwiic_eeprom_benchmark.py --save-baseline --portable
+#
+# Transactions and wire bytes don't depend on the machine, so any increase
+# is a regression. Overhead is compared with --tolerance, and only against a
+# baseline saved on the same host (platform and Python version). The
+# committed baseline.json is saved with --portable, which keeps only the
+# machine independent metrics.
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+# Benchmark the qwiic_eeprom.py next to this directory, not an installed copy
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import qwiic_eeprom
+import qwiic_eeprom_sim
+
+_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+_SIZES = [1, 16, 128, 1024, 8192, 65536]
+
+# Metrics that come out the same on every machine
+_PORTABLE_METRICS = ("ops", "payload_bytes", "transactions", "wire_bytes", "write_cycles")
+
+def host_fingerprint():
+    """
+        Describe the machine and Python the overhead was measured on
+    """
+    return {"platform": platform.platform(), "machine": platform.machine(),
+            "python": "%s %s" % (platform.python_implementation(), platform.python_version())}
+
+def make_eeprom(args, mode=qwiic_eeprom.QwiicEEPROM.WRITE_COMPLETE_POLL):
+    driver = qwiic_eeprom_sim.SimulatedEEPROMDriver(write_time_ms=args.twr, clock_hz=args.clock,
+                                                realtime=args.realtime)
+    eeprom = qwiic_eeprom.QwiicEEPROM(i2c_driver=driver)
+    eeprom.set_page_write_time(args.twr)
+    eeprom.set_write_complete_mode(mode)
+    return eeprom, driver
+
+def measure(args, driver, run, payload_bytes, ops):
+    """
+        Run run() once against driver and return its results
+    """
+    driver.reset_stats()
+    start = time.perf_counter()
+    run()
+    wall = time.perf_counter() - start
+
+    # Time the library can't help: the bus, if spent for real
+    overhead = None
+    if driver.write_cycles == 0:
+        unavoidable = driver.bus_time_s if args.realtime else 0
+        overhead = max(wall - unavoidable, 0) * 1e6 / max(payload_bytes, 1)
+    return {
+        "ops": ops,
+        "payload_bytes": payload_bytes,
+        "transactions": driver.transfers - driver.probes,
+        "polls": driver.probes,
+        "write_cycles": driver.write_cycles,
+        # Every ACK-poll is a single address byte
+        "wire_bytes": driver.bytes_written + driver.bytes_read + driver.messages - driver.probes,
+        "wall_s": wall,
+        "bus_s": driver.bus_time_s,
+        "overhead_us_per_byte": overhead,
+    }
+
+def bench_sequential_read(args, size):
+    eeprom, driver = make_eeprom(args)
+    repeats = max(1, min(1000, 65536 // size))
+    def run():
+        for repeat in range(repeats):
+            eeprom.read_bytes(0, size)
+    return measure(args, driver, run, size * repeats, repeats)
+
+def bench_sequential_write(args, size):
+    eeprom, driver = make_eeprom(args)
+    repeats = max(1, min(50, 4096 // size))
+    data = bytes(bytearray(random.Random(size).getrandbits(8) for _ in range(size)))
+    def run():
+        for repeat in range(repeats):
+            eeprom.write(0, data)
+        eeprom.flush()
+    return measure(args, driver, run, size * repeats, repeats)
+
+def bench_random_read_int(args):
+    eeprom, driver = make_eeprom(args)
+    rng = random.Random(1)
+    locations = [rng.randrange(0, 65536, 4) for _ in range(1000)]
+    def run():
+        for location in locations:
+            eeprom.read_int(location)
+    return measure(args, driver, run, 4 * len(locations), len(locations))
+
+def bench_random_write_int(args):
+    eeprom, driver = make_eeprom(args)
+    rng = random.Random(2)
+    locations = [rng.randrange(0, 65536, 4) for _ in range(100)]
+    def run():
+        for location in locations:
+            eeprom.write_int(location, location)
+        eeprom.flush()
+    return measure(args, driver, run, 4 * len(locations), len(locations))
+
+def bench_erase(args, skip_blank):
+    eeprom, driver = make_eeprom(args)
+    def run():
+        eeprom.erase(0xFF, skip_blank=skip_blank)
+        eeprom.flush()
+    return measure(args, driver, run, eeprom.length(), 1)
+
+def bench_write_then_read(args, mode):
+    """
+        Byte write followed straight away by a read: the cost of waiting out
+        the write cycle in each write complete mode
+    """
+    eeprom, driver = make_eeprom(args, mode)
+    def run():
+        for location in range(100):
+            eeprom.write_byte(location, location)
+            eeprom.read_byte(location)
+    return measure(args, driver, run, 200, 100)
+
+def run_benchmarks(args):
+    benchmarks = []
+    for size in _SIZES:
+        benchmarks.append(("sequential_read_%d" % size, lambda size=size: bench_sequential_read(args, size)))
+    for size in _SIZES:
+        benchmarks.append(("sequential_write_%d" % size, lambda size=size: bench_sequential_write(args, size)))
+    benchmarks.append(("random_read_int", lambda: bench_random_read_int(args)))
+    benchmarks.append(("random_write_int", lambda: bench_random_write_int(args)))
+    benchmarks.append(("erase", lambda: bench_erase(args, False)))
+    benchmarks.append(("erase_skip_blank", lambda: bench_erase(args, True)))
+    for name, mode in (("poll", qwiic_eeprom.QwiicEEPROM.WRITE_COMPLETE_POLL),
+                       ("delay", qwiic_eeprom.QwiicEEPROM.WRITE_COMPLETE_DELAY),
+                       ("adaptive", qwiic_eeprom.QwiicEEPROM.WRITE_COMPLETE_ADAPTIVE)):
+        benchmarks.append(("write_then_read_" + name, lambda mode=mode: bench_write_then_read(args, mode)))
+
+    results = {}
+    for name, bench in benchmarks:
+        if args.only and args.only not in name:
+            continue
+        # Best of several runs, like timeit, to keep scheduler noise out of the overhead
+        results[name] = min((bench() for repeat in range(args.repeat)), key=lambda result: result["wall_s"])
+        print_result(name, results[name])
+    return results
+
+def print_result(name, result):
+    overhead = result["overhead_us_per_byte"]
+    print("%-24s %6d ops %9d B %7d tx %6d polls %9d wire B %9.4f s wall %9.4f s bus %8s us/B" % (
+        name, result["ops"], result["payload_bytes"], result["transactions"], result["polls"],
+        result["wire_bytes"], result["wall_s"], result["bus_s"],
+        "-" if overhead is None else "%.3f" % overhead))
+
+def compare(results, baseline, tolerance, check_overhead):
+    """
+        Print every regression against the baseline and return how many there were
+    """
+    regressions = 0
+    for name, result in sorted(results.items()):
+        before = baseline.get(name)
+        if before is None:
+            continue
+        for metric in ("transactions", "wire_bytes"):
+            if result[metric] > before[metric]:
+                print("REGRESSION %s: %s %d -> %d" % (name, metric, before[metric], result[metric]))
+                regressions = regressions + 1
+        # Benchmarks with write cycles don't measure overhead
+        if not check_overhead or result["overhead_us_per_byte"] is None or before.get("overhead_us_per_byte") is None:
+            continue
+        limit = before["overhead_us_per_byte"] * (1 + tolerance)
+        if result["overhead_us_per_byte"] > limit and result["overhead_us_per_byte"] - before["overhead_us_per_byte"] > 0.05:
+            print("REGRESSION %s: overhead %.3f -> %.3f us/B" % (
+                name, before["overhead_us_per_byte"], result["overhead_us_per_byte"]))
+            regressions = regressions + 1
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark QwiicEEPROM against a simulated EEPROM bus")
+    parser.add_argument("--clock", type=int, default=400000, help="I2C bus clock in Hz (default 400000)")
+    parser.add_argument("--twr", type=float, default=5, help="write cycle time in ms (default 5)")
+    parser.add_argument("--realtime", action="store_true", help="spend the bus time for real")
+    parser.add_argument("--only", help="run only the benchmarks whose name contains this")
+    parser.add_argument("--repeat", type=int, default=3, help="runs of each benchmark, the best is kept (default 3)")
+    parser.add_argument("--baseline", default=_BASELINE, help="baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="store the results as the baseline")
+    parser.add_argument("--portable", action="store_true",
+                        help="with --save-baseline, store only the machine independent metrics")
+    parser.add_argument("--tolerance", type=float, default=0.5,
+                        help="allowed relative increase in overhead per byte (default 0.5)")
+    args = parser.parse_args()
+
+    config = {"clock_hz": args.clock, "write_time_ms": args.twr, "realtime": args.realtime}
+    print("QwiicEEPROM benchmark: %d Hz bus, %g ms write cycle%s\n" % (
+        args.clock, args.twr, ", realtime bus" if args.realtime else ""))
+    results = run_benchmarks(args)
+
+    if args.save_baseline:
+        host = host_fingerprint()
+        if args.portable:
+            host = None
+            results = dict((name, dict((metric, result[metric]) for metric in _PORTABLE_METRICS))
+                           for name, result in results.items())
+        with open(args.baseline, "w") as baseline_file:
+            json.dump({"config": config, "host": host, "results": results}, baseline_file, indent=2, sort_keys=True)
+            baseline_file.write("\n")
+        print("\nBaseline saved to " + args.baseline)
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("\nNo baseline at %s, run with --save-baseline to create one" % args.baseline)
+        return 0
+    with open(args.baseline) as baseline_file:
+        baseline = json.load(baseline_file)
+    if baseline["config"] != config:
+        print("\nBaseline was recorded with %s, not comparing" % baseline["config"])
+        return 0
+
+    print()
+    check_overhead = baseline.get("host") == host_fingerprint()
+    if not check_overhead:
+        print("Baseline wasn't saved on this host, not comparing overhead")
+    regressions = compare(results, baseline["results"], args.tolerance, check_overhead)
+    if regressions:
+        print("\n%d regression(s) against %s" % (regressions, args.baseline))
+        return 1
+    print("No regressions against " + args.baseline)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
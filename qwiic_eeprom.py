@@ -50,16 +50,467 @@ New to qwiic? Take a look at the entire [SparkFun Qwiic Ecosystem](https://www.s
 """
 # ----------------------------------------------------------------------
 
+import array
+import asyncio
+import atexit
+import bisect
+import collections
+import ctypes
+import errno
+import functools
+import io
 import math
 import time
 import qwiic_i2c
 import smbus2
 import struct
+import sys
+import threading
+from concurrent.futures import Future
 
 _DEFAULT_NAME = "Qwiic EEPROM"
 
 _AVAILABLE_I2C_ADDRESS = [0x50, 0x51, 0x52, 0x53, 0x54, 0x55, 0x56, 0x57]
 
+# Largest single message the Linux i2c-dev interface accepts in an I2C_RDWR
+# transfer. Adapters with tighter limits reject longer messages before any
+# bus traffic happens, so the real limit is learned from the first rejection.
+_I2C_RDWR_MAX_MSG_LEN = 8192
+
+# Errors returned when a message is longer than the bus adapter can carry
+_TRANSFER_TOO_LONG_ERRNOS = (errno.EINVAL, errno.EOPNOTSUPP, errno.EMSGSIZE)
+
+# Most messages the Linux i2c-dev interface accepts in one I2C_RDWR transfer
+_I2C_RDWR_MAX_MSGS = 42
+
+# i2c_msg flag marking a read message (linux/i2c.h)
+_I2C_M_RD = 0x0001
+
+# Geometry of the 24xx-series EEPROMs that take two byte memory addresses.
+# Parts over 512kbit select each 64kB block with bits of the I2C address.
+_DEVICE_PROFILES = {
+    "24xx32":   {"memory_size_bytes": 4096,   "page_size_bytes": 32,  "page_write_time_ms": 5, "block_select_shift": 2},
+    "24xx64":   {"memory_size_bytes": 8192,   "page_size_bytes": 32,  "page_write_time_ms": 5, "block_select_shift": 2},
+    "24xx128":  {"memory_size_bytes": 16384,  "page_size_bytes": 64,  "page_write_time_ms": 5, "block_select_shift": 2},
+    "24xx256":  {"memory_size_bytes": 32768,  "page_size_bytes": 64,  "page_write_time_ms": 5, "block_select_shift": 2},
+    "24xx512":  {"memory_size_bytes": 65536,  "page_size_bytes": 128, "page_write_time_ms": 5, "block_select_shift": 2},
+    "24xx1025": {"memory_size_bytes": 131072, "page_size_bytes": 128, "page_write_time_ms": 5, "block_select_shift": 2},
+    "24xx1026": {"memory_size_bytes": 131072, "page_size_bytes": 128, "page_write_time_ms": 5, "block_select_shift": 0},
+    "24CM02":   {"memory_size_bytes": 262144, "page_size_bytes": 256, "page_write_time_ms": 5, "block_select_shift": 0},
+}
+
+# Geometry found by QwiicEEPROM.detect(), keyed by (bus, I2C address)
+_detected_profiles = {}
+
+# struct and array module type codes of the fixed-width types stored in EEPROM
+_TYPE_CODES = {
+    "int8": "b", "uint8": "B",
+    "int16": "h", "uint16": "H",
+    "int32": "i", "uint32": "I",
+    "int64": "q", "uint64": "Q",
+    "float32": "f", "float64": "d",
+}
+
+# Precompiled codecs for each fixed-width type and byte order, keyed by (dtype, byteorder)
+_CODECS = dict(((name, byteorder), struct.Struct(prefix + code))
+               for name, code in _TYPE_CODES.items()
+               for byteorder, prefix in (("little", "<"), ("big", ">")))
+
+#-----------------------------------------------------------------------
+# Helpers to build I2C_RDWR messages that use the caller's memory as the
+# message buffer, so no per-byte copies are made on the way to the bus.
+def _rdwr_write_msg(address, data):
+    """
+        Build an I2C_RDWR write message that sends data (a bytearray)
+    """
+    buf = (ctypes.c_char * len(data)).from_buffer(data)
+    return smbus2.i2c_msg(addr=address, flags=0, len=len(data), buf=buf)
+
+def _rdwr_read_msg(address, view):
+    """
+        Build an I2C_RDWR read message that fills view (a writable byte memoryview)
+    """
+    buf = (ctypes.c_char * len(view)).from_buffer(view)
+    return smbus2.i2c_msg(addr=address, flags=_I2C_M_RD, len=len(view), buf=buf)
+
+def _changed_span(old, new):
+    """
+        Return (first, end) bounding the bytes that differ between two
+        equal length byte memoryviews, or None if they are the same. Uses
+        binary searches over slice comparisons, so no per-byte Python work.
+    """
+    if old == new:
+        return None
+
+    # First differing byte: shortest prefix that doesn't match
+    low, high = 0, len(new) - 1
+    while low < high:
+        mid = (low + high) // 2
+        if old[:mid + 1] == new[:mid + 1]:
+            low = mid + 1
+        else:
+            high = mid
+    first = low
+
+    # Last differing byte: shortest suffix that doesn't match
+    low, high = first, len(new) - 1
+    while low < high:
+        mid = (low + high + 1) // 2
+        if old[mid:] == new[mid:]:
+            high = mid - 1
+        else:
+            low = mid
+    return first, low + 1
+
+def _byte_view(data):
+    """
+        Return data as a byte memoryview. Buffers (bytes, bytearray,
+        memoryview, array) are used as they are; lists of ints are copied
+        into bytes once.
+    """
+    try:
+        view = memoryview(data)
+        if view.contiguous:
+            return view.cast("B")
+    except TypeError:
+        pass
+    try:
+        return memoryview(bytes(data))
+    except TypeError:
+        return memoryview(bytes([int(x) for x in data]))
+
+def _bus_key(i2c_driver):
+    """
+        Identify the bus behind i2c_driver: its Linux bus number if it has
+        one, otherwise the driver object itself
+    """
+    key = getattr(i2c_driver, "_iBus", None)
+    if key is None:
+        key = i2c_driver
+    return key
+
+def _dtype_name(dtype):
+    """
+        Return the name of dtype, a type name such as "float32" or a NumPy
+        dtype or scalar type, checking it is one we can store
+    """
+    name = getattr(dtype, "name", None) or getattr(dtype, "__name__", None) or dtype
+    if name not in _TYPE_CODES:
+        raise ValueError("Unsupported dtype %r, expected one of %s" % (dtype, ", ".join(_TYPE_CODES)))
+    return name
+
+def _array_typecode(dtype):
+    """
+        Return the array module type code for dtype
+    """
+    return _TYPE_CODES[_dtype_name(dtype)]
+
+def _codec(dtype, byteorder):
+    """
+        Return the precompiled struct.Struct that packs and unpacks one
+        dtype value in the given byte order
+    """
+    codec = _CODECS.get((dtype, byteorder))
+    if codec is None:
+        _check_byteorder(byteorder)
+        codec = _CODECS[(_dtype_name(dtype), byteorder)]
+    return codec
+
+def _check_byteorder(byteorder):
+    """
+        Raise ValueError unless byteorder is "little" or "big"
+    """
+    if byteorder not in ("little", "big"):
+        raise ValueError("byteorder must be 'little' or 'big', not %r" % (byteorder,))
+
+# Locks shared by every thread-safe QwiicEEPROM on the same I2C bus
+_bus_locks = {}
+_bus_locks_guard = threading.Lock()
+
+def get_bus_lock(i2c_driver):
+    """
+        Return the lock thread-safe QwiicEEPROM objects hold around each
+        transaction on the bus behind i2c_driver. Drivers for the same Linux
+        bus number share one lock. Hold it to keep other code's transactions
+        on the bus from interleaving with the EEPROM's.
+
+        :param i2c_driver: a qwiic_i2c driver object
+        :return: the bus lock
+        :rtype: threading.RLock
+    """
+    key = _bus_key(i2c_driver)
+    with _bus_locks_guard:
+        lock = _bus_locks.get(key)
+        if lock is None:
+            lock = _bus_locks[key] = threading.RLock()
+        return lock
+
+def _synchronized(method):
+    """
+        Run a QwiicEEPROM method holding the device lock, if the object has one
+    """
+    @functools.wraps(method)
+    def locked_method(self, *args, **kwargs):
+        lock = self._lock
+        if lock is None:
+            return method(self, *args, **kwargs)
+        with lock:
+            return method(self, *args, **kwargs)
+    return locked_method
+
+def _bus_transaction(method):
+    """
+        Run a QwiicEEPROM bus transaction holding the bus lock, if the object has one
+    """
+    @functools.wraps(method)
+    def locked_method(self, *args, **kwargs):
+        lock = self._bus_lock
+        if lock is None:
+            return method(self, *args, **kwargs)
+        with lock:
+            return method(self, *args, **kwargs)
+    return locked_method
+
+class _CachedPage(object):
+    """
+        A page held in the write-back cache: the page contents and the
+        sorted, non-overlapping [start, end) offsets that hold new data.
+    """
+    __slots__ = ("data", "spans")
+
+    def __init__(self, page_size):
+        self.data = bytearray(page_size)
+        self.spans = []
+
+    def add_span(self, start, end):
+        """
+            Mark [start, end) dirty, merging it with overlapping or adjacent spans
+        """
+        merged = []
+        for span_start, span_end in self.spans:
+            if span_end < start or span_start > end:
+                merged.append((span_start, span_end))
+            else:
+                start = min(start, span_start)
+                end = max(end, span_end)
+        merged.append((start, end))
+        merged.sort()
+        self.spans = merged
+
+def _merge_into_pages(pages, page_size, eeprom_location, data):
+    """
+        Copy data (a byte memoryview) into the _CachedPage objects it covers
+        in pages, an OrderedDict of page number -> _CachedPage kept in least
+        recently used order.
+    """
+    written = 0
+    while written < len(data):
+        page_number, offset = divmod(eeprom_location + written, page_size)
+        amt_to_write = min(page_size - offset, len(data) - written)
+
+        page = pages.get(page_number)
+        if page is None:
+            page = pages[page_number] = _CachedPage(page_size)
+        else:
+            pages.move_to_end(page_number)
+        page.data[offset:offset + amt_to_write] = data[written:written + amt_to_write]
+        page.add_span(offset, offset + amt_to_write)
+
+        written = written + amt_to_write
+
+def _overlay_pages(pages, page_size, eeprom_location, view):
+    """
+        Copy the dirty bytes of the _CachedPage objects in pages over view,
+        which holds data read from eeprom_location.
+    """
+    read_end = eeprom_location + len(view)
+    for page_number, page in pages.items():
+        page_address = page_number * page_size
+        if page_address >= read_end or page_address + page_size <= eeprom_location:
+            continue
+        for span_start, span_end in page.spans:
+            start = max(page_address + span_start, eeprom_location)
+            end = min(page_address + span_end, read_end)
+            if start < end:
+                view[start - eeprom_location:end - eeprom_location] = page.data[start - page_address:end - page_address]
+
+class _WriteQueue(object):
+    """
+        Background writer for QwiicEEPROM.enable_write_queue(). Writes are
+        queued by the caller and programmed by a dedicated thread, page by
+        page, after merging everything that queued up while the previous
+        batch was being written.
+
+        Two locks keep this consistent: state_lock (with its condition)
+        guards the pending and in-flight data and is only held briefly, so
+        queueing a write never waits on the bus. The EEPROM's device lock is
+        held while a page is programmed, and by readers across their bus
+        read and overlay, so a reader never misses a page in transit.
+    """
+    def __init__(self, eeprom, max_pending):
+        self.eeprom = eeprom
+        self.max_pending = max_pending
+        self.state_lock = threading.Lock()
+        self.changed = threading.Condition(self.state_lock)
+        self.pending = []                               # (location, bytes, future), oldest first
+        self.inflight = collections.OrderedDict()       # page number -> _CachedPage being programmed
+        self.writing = False
+        self.closing = False
+        self.error = None
+        self.thread = threading.Thread(target=self._run, name="QwiicEEPROM writer 0x%02X" % eeprom.address)
+        self.thread.daemon = True
+        self.thread.start()
+        # The writer is a daemon thread, so drain the queue before the interpreter exits
+        atexit.register(self.close)
+
+    def submit(self, eeprom_location, data):
+        """
+            Queue a write, blocking only while the queue is full.
+
+            :return: future that completes once the data is programmed
+        """
+        future = Future()
+        with self.changed:
+            while len(self.pending) >= self.max_pending:
+                self.changed.wait()
+            self.pending.append((eeprom_location, bytes(data), future))
+            self.changed.notify_all()
+        return future
+
+    def overlay(self, eeprom_location, view):
+        """
+            Copy queued data over view, which holds data just read from
+            eeprom_location. The caller must hold the device lock across the
+            read and this call.
+        """
+        with self.state_lock:
+            if self.inflight:
+                _overlay_pages(self.inflight, self.eeprom.page_size_bytes, eeprom_location, view)
+            read_end = eeprom_location + len(view)
+            for location, data, future in self.pending:
+                start = max(location, eeprom_location)
+                end = min(location + len(data), read_end)
+                if start < end:
+                    view[start - eeprom_location:end - eeprom_location] = data[start - location:end - location]
+
+    def wait(self):
+        """
+            Block until every queued write has been programmed. Raises the
+            first error the writer hit since the last wait().
+        """
+        with self.changed:
+            while self.pending or self.writing:
+                self.changed.wait()
+            error, self.error = self.error, None
+        if error is not None:
+            raise error
+
+    def close(self):
+        """
+            Program everything still queued and stop the writer thread
+        """
+        atexit.unregister(self.close)
+        with self.changed:
+            self.closing = True
+            self.changed.notify_all()
+        self.thread.join()
+
+    def _run(self):
+        while True:
+            with self.changed:
+                while not self.pending and not self.closing:
+                    self.changed.wait()
+                if not self.pending:
+                    return
+                batch, self.pending = self.pending, []
+                page_size = self.eeprom.page_size_bytes
+                for location, data, future in batch:
+                    _merge_into_pages(self.inflight, page_size, location, memoryview(data))
+                self.writing = True
+                self.changed.notify_all()
+
+            error = None
+            try:
+                for page_number in sorted(self.inflight):
+                    # Wait out the previous page's write cycle without holding up readers
+                    self.eeprom._wait_for_write_complete()
+                    self._program_page(page_number)
+            except Exception as err:
+                error = err
+
+            with self.changed:
+                self.inflight.clear()
+                self.writing = False
+                if error is not None and self.error is None:
+                    self.error = error
+                self.changed.notify_all()
+            for location, data, future in batch:
+                if error is None:
+                    future.set_result(None)
+                else:
+                    future.set_exception(error)
+
+    def _program_page(self, page_number):
+        # Program one in-flight page and retire it, holding the device lock
+        with self.eeprom._lock:
+            self.eeprom._flush_page(page_number, self.inflight[page_number])
+            with self.state_lock:
+                del self.inflight[page_number]
+
+# Upper bounds, in seconds, of the operation latency histogram buckets
+_LATENCY_BUCKETS_S = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+                      0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class _Stats(object):
+    """
+        Counters and latency histograms of one QwiicEEPROM, with callbacks
+        that see every increment and observation. Only exists while stats
+        are enabled, so a disabled EEPROM pays one attribute check per hook.
+    """
+    COUNTERS = ("read_transactions", "write_transactions", "bytes_read", "bytes_written",
+                "polls", "busy_polls", "sleep_seconds")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.callbacks = []
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.counters = dict.fromkeys(self.COUNTERS, 0)
+            # Operation -> [per bucket counts (last one unbounded), count, sum of seconds]
+            self.latency = {}
+
+    def count(self, metric, amount = 1):
+        with self.lock:
+            self.counters[metric] = self.counters[metric] + amount
+        for callback in self.callbacks:
+            callback(metric, amount)
+
+    def observe(self, operation, seconds):
+        with self.lock:
+            histogram = self.latency.get(operation)
+            if histogram is None:
+                histogram = self.latency[operation] = [[0] * (len(_LATENCY_BUCKETS_S) + 1), 0, 0.0]
+            histogram[0][bisect.bisect_left(_LATENCY_BUCKETS_S, seconds)] += 1
+            histogram[1] = histogram[1] + 1
+            histogram[2] = histogram[2] + seconds
+        for callback in self.callbacks:
+            callback(operation + "_seconds", seconds)
+
+    def snapshot(self):
+        with self.lock:
+            stats = dict(self.counters)
+            stats["latency"] = {}
+            for operation, (buckets, count, total) in self.latency.items():
+                cumulative = 0
+                le = []
+                for bound, bucket_count in zip(_LATENCY_BUCKETS_S + (float("inf"),), buckets):
+                    cumulative = cumulative + bucket_count
+                    le.append((bound, cumulative))
+                stats["latency"][operation] = {"count": count, "sum_s": total, "buckets": le}
+        return stats
+
 class QwiicEEPROM(object):
     """
     Qwiic EEPROM
@@ -80,7 +531,22 @@ class QwiicEEPROM(object):
     memory_size_bytes = int(512 * 1024 / 8)  # kBytes to kbits / 8 bits
     page_size_bytes = 128
     page_write_time_ms = 5
+    block_select_shift = 2  # Parts over 512kbit select the 64kB block with I2C address bit 0b100
     poll_for_write_complete = True
+    skip_unchanged_writes = False
+
+    # Ways of waiting out the EEPROM write cycle before the next transaction
+    WRITE_COMPLETE_POLL = 0         # ACK-poll until the device answers
+    WRITE_COMPLETE_DELAY = 1        # Wait page_write_time_ms after the write
+    WRITE_COMPLETE_ADAPTIVE = 2     # ACK-poll around the write cycle time learned so far
+    write_complete_mode = WRITE_COMPLETE_POLL
+
+    # In adaptive mode, closest spacing of ACK-polls around the expected end of the write cycle
+    _ADAPTIVE_MIN_POLL_S = 0.0001
+
+    # ACK-polling: time between probes, and how long to wait before giving up
+    poll_interval_ms = 0.5
+    poll_timeout_ms = 50
 
     I2C_BUFFER_LENGTH = 32
 
@@ -99,13 +565,59 @@ class QwiicEEPROM(object):
         else:
             self._i2c = i2c_driver
 
+        # Largest I2C message the bus driver can carry, learned on first use
+        self._max_transfer = None
+        # Messages per I2C_RDWR transfer for sequential reads
+        self._max_read_msgs = _I2C_RDWR_MAX_MSGS
+        # Largest read message, learned apart from _max_transfer so a read
+        # rejection doesn't shrink writes; None until a read is rejected
+        self._max_read_segment = None
+
+        # Time the last write transaction was sent, None when no write cycle is pending
+        self._write_started = None
+        # Time since _write_started of the last NACKed ACK-poll of the pending write cycle
+        self._write_nacked = None
+        # Write cycle time learned from ACK-polling: sample count, smoothed mean and
+        # mean deviation, and the extremes, all in seconds
+        self._write_cycles = 0
+        self._write_cycle_mean = 0.0
+        self._write_cycle_dev = 0.0
+        self._write_cycle_min = None
+        self._write_cycle_max = None
+        # Probe with zero-length writes until the adapter says it can't
+        self._zero_length_probe = True
+
+        # Write-back page cache (page number -> _CachedPage, in LRU order), None when disabled
+        self._write_cache = None
+        self._write_cache_pages = 0
+
+        # Background writer, None when writes are programmed by the caller
+        self._write_queue = None
+
+        # Device and bus locks, None unless thread-safe mode or the write queue needs them
+        self._thread_safe = False
+        self._lock = None
+        self._bus_lock = None
+
+        # Read cache (page number -> page contents, in LRU order), None when disabled
+        self._read_cache = None
+        self._read_cache_bytes = 0
+        self._read_cache_hits = 0
+        self._read_cache_misses = 0
+
+        # Counters and latency histograms, None when disabled
+        self._stats = None
+
     # ------------------------------------------------------------------
     # is_connected(i2c_address)
     #
     # Is an actual board connected to our system?
+    @_synchronized
     def is_connected(self, i2c_address = 255):
         """
-            Determine if a Qwiic EEPROM device is connected to the system
+            Determine if a Qwiic EEPROM device is connected to the system.
+            A write cycle still running from the last write is waited out
+            first, as the EEPROM doesn't answer during it.
 
             :param i2c_address: I2C address of EEPROM. Larger EEPROMs have two addresses.
             :return: True if the device is connected, false otherwise.
@@ -113,7 +625,8 @@ class QwiicEEPROM(object):
         """
         if i2c_address == 255:
             i2c_address = self.address       
-        return qwiic_i2c.isDeviceConnected(i2c_address)
+        self._wait_for_write_complete()
+        return self._probe(i2c_address)
     
     # ------------------------------------------------------------------
     # begin()
@@ -132,24 +645,64 @@ class QwiicEEPROM(object):
         return False
 
     # ------------------------------------------------------------------
-    # erase(to_write)
+    # erase(to_write, start, end, skip_blank)
     #
-    # Erase entire EEPROM
-    def erase(self, to_write = 0x00):
+    # Erase entire EEPROM, or part of it, one full page write at a time
+    def erase(self, to_write = 0x00, start = 0, end = None, skip_blank = False):
         """
-            Erase entire EEPROM.
+            Erase entire EEPROM, or the range [start, end). Each page is
+            programmed with a single page write.
             
             :param to_write: byte to write into each spot of EEPROM 
+            :param start: first address to erase
+            :param end: address after the last one to erase, defaults to
+                the end of the EEPROM
+            :param skip_blank: read the range first and leave pages that
+                already hold only to_write untouched
             :return: Nothing
             :rtype: void
         """
-        temp_buffer = []
+        if end is None or end > self.length():
+            end = int(self.length())
+        if start >= end:
+            return
+        stats = self._stats
+        if stats is not None:
+            started = time.perf_counter()
 
-        for x in range(0, self.page_size_bytes):
-            temp_buffer.append(to_write)
-        
-        for addr in range(0, int(self.length()), self.page_size_bytes):
-            self.write(addr, temp_buffer)
+        # Anything still in the write cache or queue must not land on top of the erase
+        if self._write_cache or self._write_queue is not None:
+            self.flush()
+
+        self._erase(to_write, start, end, skip_blank)
+        if stats is not None:
+            stats.observe("erase", time.perf_counter() - started)
+
+    # ------------------------------------------------------------------
+    # _erase(to_write, start, end, skip_blank)
+    #
+    # Program [start, end) with to_write, a page at a time
+    @_synchronized
+    def _erase(self, to_write, start, end, skip_blank):
+        """
+            Program [start, end) with to_write, one page write per page,
+            skipping pages that already hold it if skip_blank is set.
+        """
+        page_size = self.page_size_bytes
+        blank_page = memoryview(bytes((to_write,)) * page_size)
+
+        current = None
+        if skip_blank == True:
+            current = memoryview(bytearray(end - start))
+            self._read_device_into(start, current)
+
+        addr = start
+        while addr < end:
+            page_end = min(addr - addr % page_size + page_size, end)
+            amt_to_write = page_end - addr
+            if current is None or current[addr - start:page_end - start] != blank_page[:amt_to_write]:
+                self._write_span(addr, blank_page[:amt_to_write])
+            addr = page_end
     
     # ------------------------------------------------------------------
     # length()
@@ -171,6 +724,8 @@ class QwiicEEPROM(object):
     def is_busy(self, i2c_address = 255):
         """
             Returns true if the device is not answering (currently writing).
+            Probes the device through this object's I2C driver without
+            transferring any data.
 
             :param i2c_address: I2C address of EEPROM. Larger EEPROMs have two addresses.
             :return: True if the IC is busy, false otherwise
@@ -179,9 +734,7 @@ class QwiicEEPROM(object):
         if i2c_address == 255:
             i2c_address = self.address
 
-        if self.is_connected(i2c_address) == True:
-            return False
-        return True
+        return not self._probe(i2c_address)
 
     # ------------------------------------------------------------------
     # set_memory_size(mem_size)
@@ -195,7 +748,11 @@ class QwiicEEPROM(object):
             :return: Nothing
             :rtype: void
         """
-        self.memory_size_bytes = mem_size
+        if self._write_cache or self._write_queue is not None:
+            self.flush()
+        self.memory_size_bytes = int(mem_size)
+        if self._read_cache is not None:
+            self._read_cache.clear()
 
     # ------------------------------------------------------------------
     # get_memory_size()
@@ -209,6 +766,236 @@ class QwiicEEPROM(object):
             :rtype: int
         """
         return self.memory_size_bytes
+
+    # ------------------------------------------------------------------
+    # set_block_select_bit(bit)
+    #
+    # Set which I2C address bit selects the 64kB block on large EEPROMs
+    def set_block_select_bit(self, bit):
+        """
+            Set which bit of the I2C address selects the 64kB block on
+            EEPROMs larger than 512kbit. The 24xx1025 uses bit 2 (0b100, the
+            default). The 24xx1026 and 24CM02 use bit 0, with bit 1 also set
+            for the upper two blocks of the 2Mbit part.
+
+            :param bit: I2C address bit number of the lowest block select bit
+            :return: Nothing
+            :rtype: void
+        """
+        self.block_select_shift = bit
+
+    # ------------------------------------------------------------------
+    # get_block_select_bit()
+    #
+    # Return which I2C address bit selects the 64kB block
+    def get_block_select_bit(self):
+        """
+            Return which bit of the I2C address selects the 64kB block
+
+            :return: block_select_shift
+            :rtype: int
+        """
+        return self.block_select_shift
+
+    # ------------------------------------------------------------------
+    # set_device_profile(part)
+    #
+    # Set the memory size, page size, write time and block select bit for a known part
+    def set_device_profile(self, part):
+        """
+            Set the memory size, page size, write time and block select bit
+            of a known EEPROM part, see get_device_profiles()
+
+            :param part: part name, such as "24xx512" or "24xx1025"
+            :return: Nothing
+            :rtype: void
+        """
+        if part not in _DEVICE_PROFILES:
+            raise ValueError("Unknown EEPROM part %r, expected one of %s" % (part, ", ".join(_DEVICE_PROFILES)))
+        self._apply_profile(_DEVICE_PROFILES[part])
+
+    # ------------------------------------------------------------------
+    # get_device_profiles()
+    #
+    # Return the names of the known parts
+    def get_device_profiles(self):
+        """
+            Return the names of the EEPROM parts set_device_profile() knows
+
+            :return: part names
+            :rtype: list
+        """
+        return list(_DEVICE_PROFILES)
+
+    # ------------------------------------------------------------------
+    # detect(force)
+    #
+    # Probe the EEPROM for its memory size and page size
+    def detect(self, force = False):
+        """
+            Work out the memory size, page size and block select bit of the
+            connected EEPROM and use them. The memory size is where memory
+            addresses wrap around, the page size is where a write wraps
+            around inside its page, and parts over 512kbit are found by
+            which block address belongs to the same chip. A few bytes at the
+            start of memory are changed along the way and then restored.
+            The result is cached per bus and address, so only the first call
+            touches the EEPROM.
+
+            :param force: probe the EEPROM even if a result is cached
+            :return: the detected geometry, and the matching "part" name or None
+            :rtype: dict
+        """
+        key = (_bus_key(self._i2c), self.address)
+        profile = None if force else _detected_profiles.get(key)
+        if profile is None:
+            self.flush()
+            profile = self._detect()
+            _detected_profiles[key] = profile
+        self._apply_profile(profile)
+        return dict(profile)
+
+    # ------------------------------------------------------------------
+    # _apply_profile(profile)
+    #
+    # Use the geometry in a profile
+    def _apply_profile(self, profile):
+        """
+            Set the memory size, page size, write time and block select bit
+            from a profile dict
+        """
+        self.set_memory_size(profile["memory_size_bytes"])
+        self.set_page_size(profile["page_size_bytes"])
+        self.set_page_write_time(profile["page_write_time_ms"])
+        self.set_block_select_bit(profile["block_select_shift"])
+
+    # ------------------------------------------------------------------
+    # _detect()
+    #
+    # Probe the EEPROM geometry
+    @_synchronized
+    def _detect(self):
+        """
+            Probe the EEPROM and return its profile dict, with the name of
+            the matching known part under "part"
+        """
+        memory_size = self._detect_memory_size()
+        block_select_shift = self.block_select_shift
+        if memory_size is None:
+            memory_size, block_select_shift = self._detect_blocks()
+        page_size = self._detect_page_size()
+        self._wait_for_write_complete()
+        if self._read_cache is not None:
+            self._read_cache.clear()
+
+        profile = {"part": None,
+                   "memory_size_bytes": memory_size,
+                   "page_size_bytes": page_size,
+                   "page_write_time_ms": self.page_write_time_ms,
+                   "block_select_shift": block_select_shift}
+        for part, known in _DEVICE_PROFILES.items():
+            if known["memory_size_bytes"] == memory_size and known["page_size_bytes"] == page_size \
+                    and (memory_size <= 0x10000 or known["block_select_shift"] == block_select_shift):
+                profile.update(known, part=part)
+                break
+        return profile
+
+    # ------------------------------------------------------------------
+    # _detect_memory_size()
+    #
+    # Find where memory addresses wrap around
+    def _detect_memory_size(self):
+        """
+            Return the memory size of a part smaller than 64kB, or None.
+            Smaller parts ignore the upper memory address bits, so a marker
+            written at 0 also shows up at the memory size.
+        """
+        candidates = [4096 << n for n in range(4)]
+        original = self._read_device_bytes(0, 1)
+        before = [self._read_device_bytes(size, 1) for size in candidates]
+        marker = bytes((original[0] ^ 0xFF,))
+
+        self._write_span(0, memoryview(marker))
+        memory_size = None
+        for size, value in zip(candidates, before):
+            if value != marker and self._read_device_bytes(size, 1) == marker:
+                memory_size = size
+                break
+        self._write_span(0, memoryview(original))
+        return memory_size
+
+    # ------------------------------------------------------------------
+    # _detect_blocks()
+    #
+    # Find how many 64kB blocks a part has and how they are selected
+    def _detect_blocks(self):
+        """
+            Return (memory size, block select bit) for a part of 64kB or
+            more, trying the 24xx1025 block bit first and then the
+            24xx1026/24CM02 ones.
+        """
+        for shift in (2, 0):
+            if not self._same_chip(self.address | (1 << shift)):
+                continue
+            if shift == 0 and self._same_chip(self.address | 0b11):
+                return 0x40000, shift
+            return 0x20000, shift
+        return 0x10000, self.block_select_shift
+
+    # ------------------------------------------------------------------
+    # _same_chip(i2c_address)
+    #
+    # Is another I2C address answered by this EEPROM?
+    def _same_chip(self, i2c_address):
+        """
+            Return True if i2c_address belongs to this EEPROM. A byte is
+            rewritten with its own value; another chip keeps answering
+            during the write cycle, this one doesn't.
+        """
+        if i2c_address == self.address:
+            return False
+        self._wait_for_write_complete()
+        if not self._probe(i2c_address):
+            return False
+        self._write_span(0, memoryview(self._read_device_bytes(0, 1)))
+        same = not self._probe(i2c_address)
+        self._wait_for_write_complete()
+        return same
+
+    # ------------------------------------------------------------------
+    # _detect_page_size()
+    #
+    # Find where a write wraps around inside its page
+    def _detect_page_size(self):
+        """
+            Return the page size. Two bytes are written across each candidate
+            page boundary in one transaction; on the first boundary that is
+            really a page end, the second byte wraps to the start of the page.
+        """
+        candidates = [8 << n for n in range(6)]
+        original = self._read_device_bytes(0, candidates[-1] + 1)
+        for size in candidates:
+            marker = original[size] ^ 0xFF
+            self._wait_for_write_complete()
+            self._write_chunk(self.address, size - 1, bytes((original[size - 1], marker)))
+            if self._read_device_bytes(size, 1)[0] == marker:
+                self._write_span(size, memoryview(original[size:size + 1]))
+            else:
+                self._write_span(0, memoryview(original[0:1]))
+                return size
+        return candidates[-1]
+
+    # ------------------------------------------------------------------
+    # _read_device_bytes(eeprom_location, num_bytes)
+    #
+    # Read straight from the EEPROM, bypassing the caches
+    def _read_device_bytes(self, eeprom_location, num_bytes):
+        """
+            Read num_bytes from the EEPROM itself into a new bytearray
+        """
+        data = bytearray(num_bytes)
+        self._read_device_into(eeprom_location, memoryview(data))
+        return data
     
     # ------------------------------------------------------------------
     # set_page_size(page_size)
@@ -222,7 +1009,11 @@ class QwiicEEPROM(object):
             :return: Nothing
             :rtype: void
         """
+        if self._write_cache or self._write_queue is not None:
+            self.flush()
         self.page_size_bytes = page_size
+        if self._read_cache is not None:
+            self._read_cache.clear()
     
     # ------------------------------------------------------------------
     # get_page_size()
@@ -276,6 +1067,7 @@ class QwiicEEPROM(object):
             :rtype: Void
         """
         self.poll_for_write_complete = True
+        self.write_complete_mode = self.WRITE_COMPLETE_POLL
 
     # ------------------------------------------------------------------
     # disable_poll_for_write_complete()
@@ -289,323 +1081,2396 @@ class QwiicEEPROM(object):
             :rtype: Void
         """
         self.poll_for_write_complete = False
+        self.write_complete_mode = self.WRITE_COMPLETE_DELAY
 
     # ------------------------------------------------------------------
-    # set_I2C_buffer_size(buff_size)
+    # set_poll_interval(interval_ms)
     #
-    # Set the size of the TX buffer
-    def set_I2C_buffer_size(self, buff_size):
+    # Set the time between ACK-polls while waiting for a write to complete
+    def set_poll_interval(self, interval_ms):
         """
-            Set the size of the TX buffer
-            
-            :param buff_size: the size of the I2C buffer
-            :return: nothing
+            Set the time between ACK-polls while waiting for a write to
+            complete. Shorter intervals notice the end of the write cycle
+            sooner but put more traffic on the bus.
+
+            :param interval_ms: time between polls in ms (0 polls back to back)
+            :return: Nothing
             :rtype: Void
         """
-        self.I2C_BUFFER_LENGTH = buff_size
-        
+        self.poll_interval_ms = interval_ms
+
     # ------------------------------------------------------------------
-    # get_I2C_buffer_size()
+    # get_poll_interval()
     #
-    # Return the size of the TX buffer
-    def get_I2C_buffer_size(self):
+    # Get the time between ACK-polls
+    def get_poll_interval(self):
         """
-            Return the size of the TX buffer
+            Get the time between ACK-polls
 
-            :return: I2C_BUFFER_LENGTH_TX
-            :rtype: int
+            :return: Time between polls in ms
+            :rtype: float
         """
-        return self.I2C_BUFFER_LENGTH
-    
+        return self.poll_interval_ms
+
     # ------------------------------------------------------------------
-    # read_byte(eeprom_location)
+    # set_poll_timeout(timeout_ms)
     #
-    # Read a byte from a given EEPROM location
-    def read_byte(self, eeprom_location):
+    # Set how long to ACK-poll before giving up on a write
+    def set_poll_timeout(self, timeout_ms):
         """
-            Read exactly one byte from EEPROM at a given address location
-            
-            :param eeprom_location: location in EEPROM to read byte from
-            :return: byte read from EEPROM
-            :rtype: byte
+            Set how long after a write to keep ACK-polling before giving up
+            and raising TimeoutError
+
+            :param timeout_ms: timeout in ms
+            :return: Nothing
+            :rtype: Void
         """
-        read_list = self.read(eeprom_location, 1)
-        
-        return read_list[0]
-    
+        self.poll_timeout_ms = timeout_ms
+
     # ------------------------------------------------------------------
-    # read_int(eeprom_location)
-    # 
-    # Read a 32-bit signed int from a given EEPROM location
-    def read_int(self, eeprom_location):
+    # get_poll_timeout()
+    #
+    # Get how long to ACK-poll before giving up on a write
+    def get_poll_timeout(self):
         """
-            Read a 32-bit signed int from a given EEPROM location
-            
-            :param eeprom_location: location in EEPROM to read int from
-            :return: int read from EEPROM
-            :rtype: int
+            Get how long to ACK-poll before giving up on a write
+
+            :return: Timeout in ms
+            :rtype: float
         """
-        num_bytes = 4   # Default to 32-bit integer
-        read_list = self.read(eeprom_location, num_bytes) 
-        
-        # Convert list of bytes into one big int
-        # First, cast list into "bytes" type
-        int_bytes = bytes(read_list)
-        # Then, conver to int
-        int_val = int.from_bytes(int_bytes, "big", signed=True)
-        
-        return int_val
-    
+        return self.poll_timeout_ms
+
     # ------------------------------------------------------------------
-    # read_float(eeprom_location)
+    # enable_skip_unchanged_writes()
     #
-    # Read 32-bit float from given EEPROM location
-    def read_float(self, eeprom_location):
+    # Compare before writing and only program bytes that actually change
+    def enable_skip_unchanged_writes(self):
         """
-            Read a 32-bit float from a given EEPROM location
-            
-            :param eeprom_location: location in EEPROM to read float from 
-            :return: float read from EEPROM
-            :rtype: float
+            Read the target span before each write and only program the part
+            of each page that differs from the new data. Saves write cycles
+            (and wear) when most of the data is already in place, at the cost
+            of one bulk read per write.
+
+            :return: Nothing
+            :rtype: Void
         """
-        num_bytes = 4
-        read_list = self.read(eeprom_location, num_bytes)
-        
-        # Convert list of bytes into a float
-        # Use bytearrays as we did in the write_float() function
-        byte_float = bytearray(read_list)
-        float_tuple = struct.unpack('f', byte_float)
-        
-        # Extract float value from the tuple returned by the unpack() function
-        float_val = float_tuple[0]
-                
-        return float_val
-        
+        self.skip_unchanged_writes = True
+
     # ------------------------------------------------------------------
-    # read_string(eeprom_location, string_length)
+    # disable_skip_unchanged_writes()
     #
-    # Read string of given length from EEPROM
-    def read_string(self, eeprom_location, string_length):
+    # Always program every byte written
+    def disable_skip_unchanged_writes(self):
         """
-            Read a stromg of given length from any address of EEPROM
-            
-            :param: eeprom_location: location in EEPROM to read string from
-            :param string_length: number of chars to read from EEPROM
-            :return: string read from EEPROM
-            :rtype: string
+            Always program every byte written, without reading first
+
+            :return: Nothing
+            :rtype: Void
         """
-        read_list = self.read(eeprom_location, string_length)
-        
-        # Convert a list of byte back into the string
-        byte_string = bytearray(read_list)
-        decoded_string = byte_string.decode()
-        
-        return decoded_string
-    
+        self.skip_unchanged_writes = False
+
     # ------------------------------------------------------------------
-    # read(eeprom_location, amt_to_read)
+    # enable_write_cache(max_pages)
     #
-    # Bulk read from EEPROM.
-    # Handles breaking up read amt into 32 byte chunks (can be overidden with set_I2C_buffer_size())
-    # Handles a read that straddles the 512kbit barrier    
-    def read(self, eeprom_location, num_bytes):
+    # Hold writes in a page cache and program them on flush() or eviction
+    @_synchronized
+    def enable_write_cache(self, max_pages = 16):
         """
-            Bulk read from EEPROM.
-            Handles breaking up read amt into 32 byte chunks (can be 
-            overidden with set_I2C_buffer_size()
-            Handles a read that straddles the 512kbit barrier
-            
-            :param eeprom_location: address of EEPROM to start reading from
-            :param num_bytes: number of bytes to be read from external EEPROM
-            :return: a list of bytes read from EEPROM
-            :rtype: list
+            Hold writes in a write-back page cache instead of programming them
+            straight away. Writes to the same page are merged and programmed
+            with a single page write when the page is evicted (least recently
+            used first, once more than max_pages pages are dirty) or when
+            flush() is called. Reads see the cached data.
+
+            :param max_pages: number of dirty pages to hold before evicting
+            :return: Nothing
+            :rtype: Void
         """
-        received = 0
-        data_list = []
+        if self._write_queue is not None:
+            raise ValueError("The write cache can't be used with the write queue")
+        if self._write_cache is None:
+            self._write_cache = collections.OrderedDict()
+        self._write_cache_pages = max_pages
+        self._evict_write_cache()
 
-        while received < num_bytes:
+    # ------------------------------------------------------------------
+    # disable_write_cache()
+    #
+    # Flush the write cache and go back to programming every write directly
+    @_synchronized
+    def disable_write_cache(self):
+        """
+            Flush the write cache and go back to programming writes directly
+
+            :return: Nothing
+            :rtype: Void
+        """
+        self.flush()
+        self._write_cache = None
 
-            # Limit the amount to write to a page size
-            amt_to_read = num_bytes - received
-            if amt_to_read > self.I2C_BUFFER_LENGTH:
-                amt_to_read = self.I2C_BUFFER_LENGTH
-            
-            # Check if we are dealing with large (>512kbit) EEPROMs
-            i2c_address = self.address
-            
-            # if self.memory_size_bytes > 0xFFFF:
-                # # Figure out if we are going to cross the barrier with this read
-                # if eeprom_location + received < 0xFFFF:
-                    # if 0xFFFF - (eeprom_location + received) < amt_to_read:   # 0xFFFF - 0xFFFA < 32
-                        # amt_to_read = 0xFFFF - (eeprom_location + received) # Limit the read amt to right up to edge of barrier
-                    
-                # # Figure out if we are accessing the lower half or the upper half
-                # if eeprom_location + received > 0xFFFF:
-                    # i2c_address |= 0b100    # Set the block bit to 1
-              
-            # See if EEPROM is available or still writing to a previous request
-            if self.poll_for_write_complete == True:
-                while self.is_busy(i2c_address) == True:
-                    time.sleep(0.001) # This shortens the amount of time waiting between writes but hammers the I2C bus
-            
-            eeprom_address_MSB = (eeprom_location + received) >> 8
-            eeprom_address_LSB = (eeprom_location + received) & 0xFF
-        
-            write_list = [eeprom_address_MSB, eeprom_address_LSB]
-            read_list = list(self._i2c.__i2c_rdwr__(i2c_address, write_list, amt_to_read))
-            
-            data_list.extend(read_list)
-            
-            received = received + amt_to_read
-        
-        return data_list
-        
     # ------------------------------------------------------------------
-    # write_byte(eeprom_location, byte_to_write)
+    # enable_write_queue(max_pending)
     #
-    # Write a single byte to a given EEPROM location
-    def write_byte(self, eeprom_location, byte_to_write):
+    # Hand writes to a background thread and return straight away
+    def enable_write_queue(self, max_pending = 64):
         """
-            Write a single byte to given EEPROM location
+            Hand writes to a background writer thread. write() queues the
+            data and returns a concurrent.futures.Future straight away; the
+            writer merges overlapping and adjacent queued writes and
+            programs them page by page. Reads see queued data. Data is only
+            on the chip once wait() or flush() returns; queued writes are
+            also drained when the interpreter exits normally, but are lost
+            if the process is killed.
 
-            :param eeprom_location: location in EEPROM to byte to 
-            :param byte_to_write: byte to write to EEPROM
+            :param max_pending: number of queued writes before write() blocks
             :return: Nothing
             :rtype: Void
         """
-        byte_list = [byte_to_write]
-        self.write(eeprom_location, byte_list)
-    
+        if self._write_cache is not None:
+            raise ValueError("The write queue can't be used with the write cache")
+        if self._write_queue is None:
+            # The writer thread and readers coordinate through the device lock
+            if self._lock is None:
+                self._lock = threading.RLock()
+            self._write_queue = _WriteQueue(self, max_pending)
+        self._write_queue.max_pending = max_pending
+
     # ------------------------------------------------------------------
-    # write_int()
+    # disable_write_queue()
     #
-    # Write a signed 32-bit int to a given EEPROM location
-    def write_int(self, eeprom_location, int_to_write):
+    # Program everything queued and stop the writer thread
+    def disable_write_queue(self):
         """
-            Write a signed 32-bit int to a given EEPROM location
-            
-            :param eeprom_location: location in EEPROM to write int to 
-            :param int_to_write: int to write to EEPROM
+            Program everything still queued, stop the writer thread and go
+            back to programming writes in the caller
+
             :return: Nothing
             :rtype: Void
         """
-        # Convert int to a list of bytes
-        num_bytes = 4 # Defaulting to 32-bit int
-        list_int = list(int_to_write.to_bytes(num_bytes, "big", signed=True))
-        
-        self.write(eeprom_location, list_int)
-    
+        if self._write_queue is not None:
+            write_queue = self._write_queue
+            write_queue.close()
+            self._write_queue = None
+            if self._thread_safe == False:
+                self._lock = None
+            write_queue.wait()
+
     # ------------------------------------------------------------------
-    # write_float()
+    # wait()
     #
-    # Write a 32-bit float to a given EEPROM location
-    def write_float(self, eeprom_location, float_to_write):
+    # Block until every queued write has been programmed
+    def wait(self):
         """
-            Write a 32-bit float to a given EEPROM location
-            
-            :param eeprom_location: location in EEPROM to write float to 
-            :param float_to_write: float to write to EEPROM
+            Block until every write handed to the write queue has been
+            programmed. Raises the first error the writer thread hit.
+
             :return: Nothing
             :rtype: Void
         """
-        # Convert float into a bytearray
-        byte_float = bytearray(struct.pack('f', float_to_write))
-        # Convert bytearray to list
-        list_float = list(byte_float)
-        
-        self.write(eeprom_location, list_float)
-    
+        if self._write_queue is not None:
+            self._write_queue.wait()
+
     # ------------------------------------------------------------------
-    # write_string()
+    # enable_thread_safety()
     #
-    # Write a string to a given EEPROM location
-    def write_string(self, eeprom_location, string_to_write):
+    # Allow the EEPROM object to be used from several threads
+    def enable_thread_safety(self):
         """
-            Write a stirng to a given EEPROM location
-            
-            :param eeprom_location: location in EEPROM to write string to
-            :param string_to_write: string to write to EEPROM
+            Allow this object to be used from several threads. Each read,
+            write or erase holds a per-device lock for its whole run, so one
+            thread's address pointer can't land in the middle of another
+            thread's transfer. Each bus transaction also holds a lock shared
+            by every thread-safe EEPROM on the same bus (see get_bus_lock()).
+            Write cycles are waited out without the bus lock, so other chips
+            on the bus carry on meanwhile.
+
             :return: Nothing
             :rtype: Void
         """
-        # Encode string to ASCII representation
-        encoded_string = string_to_write.encode()
-        byte_string = bytearray(encoded_string)
-        # Convert bytearray to list
-        list_string = list(byte_string)
-        
-        self.write(eeprom_location, list_string)
-        
+        self._thread_safe = True
+        if self._lock is None:
+            self._lock = threading.RLock()
+        self._bus_lock = get_bus_lock(self._i2c)
+
     # ------------------------------------------------------------------
-    # write
+    # disable_thread_safety()
     #
-    # Write large bulk amounts to EEPROM. Limits writes to the I2C buffer size
-    # (default is 32 bytes).
-    def write(self, eeprom_location, data_list):
+    # Drop the locks for single-threaded use
+    def disable_thread_safety(self):
         """
-            Write large bulk amounts to EEPROM. Limits write to the I2C buffer size
-            (default is 32 bytes).
-            
-            :param eeprom_location: 2-byte EEPROM address to write to 
-            :param data_list: list of data bytes to be written to EEPROM 
-                sequentially, starting at the EEPROM address
+            Drop the device and bus locks. Only do this once no other thread
+            is using the object.
+
+            :return: Nothing
+            :rtype: Void
+        """
+        self._thread_safe = False
+        self._bus_lock = None
+        if self._write_queue is None:
+            self._lock = None
+
+    # ------------------------------------------------------------------
+    # enable_read_cache(max_bytes)
+    #
+    # Keep recently read pages in memory
+    @_synchronized
+    def enable_read_cache(self, max_bytes = 4096):
+        """
+            Keep recently read pages in memory so repeated reads of the same
+            region don't go to the bus. Pages are filled on read and updated
+            on write, so the cache is only safe when nothing else writes to
+            the EEPROM. The least recently used pages are dropped once the
+            cache holds more than max_bytes.
+
+            :param max_bytes: size of the cache in bytes
+            :return: Nothing
+            :rtype: Void
+        """
+        if self._read_cache is None:
+            self._read_cache = collections.OrderedDict()
+        self._read_cache_bytes = max_bytes
+        while len(self._read_cache) * self.page_size_bytes > max_bytes:
+            self._read_cache.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # disable_read_cache()
+    #
+    # Drop the read cache and read from the EEPROM every time
+    @_synchronized
+    def disable_read_cache(self):
+        """
+            Drop the read cache and read from the EEPROM every time
+
+            :return: Nothing
+            :rtype: Void
+        """
+        self._read_cache = None
+
+    # ------------------------------------------------------------------
+    # get_read_cache_stats()
+    #
+    # Return the read cache hit and miss counts
+    def get_read_cache_stats(self):
+        """
+            Return the read cache counters. Hits and misses are counted per
+            page looked up.
+
+            :return: dictionary with "hits", "misses" and "pages" (pages
+                currently cached)
+            :rtype: dict
+        """
+        pages = 0 if self._read_cache is None else len(self._read_cache)
+        return {"hits": self._read_cache_hits, "misses": self._read_cache_misses, "pages": pages}
+
+    # ------------------------------------------------------------------
+    # enable_stats()
+    #
+    # Start counting transactions, bytes, polls and sleeps
+    def enable_stats(self):
+        """
+            Start counting bus transactions, bytes moved, ACK-polls and time
+            slept waiting for write cycles, and timing read, write, erase
+            and flush calls. Disabled, the counting costs one attribute
+            check per transaction.
+
+            :return: Nothing
+            :rtype: Void
+        """
+        if self._stats is None:
+            self._stats = _Stats()
+
+    # ------------------------------------------------------------------
+    # disable_stats()
+    #
+    # Stop counting and drop the stats
+    def disable_stats(self):
+        """
+            Stop counting, dropping the stats and their callbacks
+
+            :return: Nothing
+            :rtype: Void
+        """
+        self._stats = None
+
+    # ------------------------------------------------------------------
+    # reset_stats()
+    #
+    # Zero the counters and histograms
+    def reset_stats(self):
+        """
+            Zero the counters and latency histograms, keeping the callbacks
+
+            :return: Nothing
+            :rtype: Void
+        """
+        if self._stats is not None:
+            self._stats.reset()
+
+    # ------------------------------------------------------------------
+    # get_stats()
+    #
+    # Return the counters and latency histograms
+    def get_stats(self):
+        """
+            Return the counters: "read_transactions", "write_transactions",
+            "bytes_read" and "bytes_written" on the bus, "polls" and
+            "busy_polls" (ACK-polls, and those the EEPROM NACKed while
+            busy), and "sleep_seconds" spent waiting for write cycles.
+            "latency" maps "read", "write", "erase" and "flush" to a
+            histogram: {"count", "sum_s", "buckets": [(upper bound in
+            seconds, cumulative count), ...]}, the last bound being inf.
+
+            :return: the stats, or None if they aren't enabled
+            :rtype: dict
+        """
+        if self._stats is None:
+            return None
+        return self._stats.snapshot()
+
+    # ------------------------------------------------------------------
+    # add_stats_callback(callback)
+    #
+    # Call a function on every counter increment and latency observation
+    def add_stats_callback(self, callback):
+        """
+            Call callback(metric, amount) on every counter increment, with a
+            counter name from get_stats(), and callback(operation +
+            "_seconds", seconds) on every latency observation, such as
+            ("write_seconds", 0.0031). Enables stats if they aren't. This is
+            the place to feed Prometheus style counters and histograms.
+            Callbacks run on the thread doing the I/O and must be quick.
+
+            :param callback: function taking (metric, amount)
+            :return: Nothing
             :rtype: Void
+        """
+        self.enable_stats()
+        self._stats.callbacks.append(callback)
+
+    # ------------------------------------------------------------------
+    # set_write_complete_mode(mode)
+    #
+    # Choose how to wait for the EEPROM to finish a write cycle
+    def set_write_complete_mode(self, mode):
+        """
+            Choose how to wait for the EEPROM to finish a write cycle. The
+            wait happens right before the next transaction, so a write that
+            is not followed by another access returns straight away.
+
+            :param mode: WRITE_COMPLETE_POLL to ACK-poll the device,
+                WRITE_COMPLETE_DELAY to wait page_write_time_ms, or
+                WRITE_COMPLETE_ADAPTIVE to sleep until just before the write
+                cycle time learned from earlier ACK-polls and then ACK-poll,
+                see get_write_cycle_stats()
+            :return: Nothing
+            :rtype: Void
+        """
+        if mode not in (self.WRITE_COMPLETE_POLL, self.WRITE_COMPLETE_DELAY, self.WRITE_COMPLETE_ADAPTIVE):
+            raise ValueError("Unknown write complete mode: " + str(mode))
+        self.write_complete_mode = mode
+        self.poll_for_write_complete = mode != self.WRITE_COMPLETE_DELAY
+
+    # ------------------------------------------------------------------
+    # get_write_complete_mode()
+    #
+    # Return how we wait for the EEPROM to finish a write cycle
+    def get_write_complete_mode(self):
+        """
+            Return how we wait for the EEPROM to finish a write cycle
+
+            :return: WRITE_COMPLETE_POLL, WRITE_COMPLETE_DELAY or WRITE_COMPLETE_ADAPTIVE
+            :rtype: int
+        """
+        return self.write_complete_mode
+
+    # ------------------------------------------------------------------
+    # get_write_cycle_stats()
+    #
+    # Return the write cycle times measured by ACK-polling
+    def get_write_cycle_stats(self):
+        """
+            Return the write cycle times measured by ACK-polling. Each
+            measurement is the middle of the time between the last NACKed
+            poll and the first ACKed one. The mean and deviation are
+            smoothed so they follow changes in supply voltage and temperature.
+
+            :return: dict with "count", and "mean_ms", "deviation_ms",
+                "min_ms" and "max_ms" (None before the first measurement)
+            :rtype: dict
+        """
+        def to_ms(seconds):
+            return None if seconds is None or self._write_cycles == 0 else seconds * 1000
+        return {"count": self._write_cycles,
+                "mean_ms": to_ms(self._write_cycle_mean),
+                "deviation_ms": to_ms(self._write_cycle_dev),
+                "min_ms": to_ms(self._write_cycle_min),
+                "max_ms": to_ms(self._write_cycle_max)}
+
+    # ------------------------------------------------------------------
+    # set_I2C_buffer_size(buff_size)
+    #
+    # Set the size of the TX buffer
+    def set_I2C_buffer_size(self, buff_size):
+        """
+            Set the size of the TX buffer
+            
+            :param buff_size: the size of the I2C buffer
             :return: nothing
+            :rtype: Void
         """
-        buffer_size = len(data_list)
-        
-        # Error check
-        if eeprom_location + buffer_size >= self.memory_size_bytes:
-            buffer_size = self.memory_size_bytes - eeprom_location
-        
-        max_write_size = self.page_size_bytes
-        if max_write_size > self.I2C_BUFFER_LENGTH - 2:
-            max_write_size = self.I2C_BUFFER_LENGTH - 2 # We loose two bytes to the EEPROM address
+        self.I2C_BUFFER_LENGTH = buff_size
+        self._max_transfer = buff_size
+        self._max_read_segment = None
         
-        # Break the buffer into page sized chunks
-        recorded = 0
-        while recorded < buffer_size:
-            
-            # Limit the amount to write to either the page size or the Rasp Pi limit
-            amt_to_write = buffer_size - recorded
-            if amt_to_write > max_write_size:
-                amt_to_write = max_write_size
-            
-            if amt_to_write > 1:
-                # check for crossing of a page line. Writes cannot cross a page line.
-                page_number_1 = int((eeprom_location + recorded) / self.page_size_bytes)
-                page_number_2 = int((eeprom_location + recorded + amt_to_write - 1) / self.page_size_bytes)
-                if page_number_2 > page_number_1:
-                    amt_to_write = (page_number_2 * self.page_size_bytes) - (eeprom_location + recorded) # Limit the read amt to go right up to edge of page barrier
-                    
-            i2c_address = self.address
-            # # Check if we are dealing with large (>512kbit) EEPROMs
-            # if self.memory_size_bytes > 0xFFFF:
-                # # Figure out if we are accessing the lower half or the upper half
-                # if eeprom_location + recorded > 0xFFFF:
-                    # i2c_address |= 0b100    # Set the block bit to 1
-            
-            # See if EEPROM is available or still writing a previous request
-            if self.poll_for_write_complete == True:
-                while self.is_busy(i2c_address) == True:   # Poll device
-                    time.sleep(0.001) # This shortens the amount of time waiting between writes but hammers the I2C bus
-            
-            eeprom_address_MSB = (eeprom_location + int(recorded)) >> 8
-            eeprom_address_LSB = (eeprom_location + int(recorded)) & 0xFF
-            temp_write_list = [eeprom_address_LSB]
-            
-            for x in range(0, int(amt_to_write)):
-                temp_write_list.append(int(data_list[int(recorded) + x]))
-            
-            # Now, set up the full write
-            self._i2c.writeBlock(i2c_address, eeprom_address_MSB, temp_write_list)
-                
-            # Increment "recorded" counter
-            recorded = recorded + amt_to_write
+    # ------------------------------------------------------------------
+    # get_I2C_buffer_size()
+    #
+    # Return the size of the TX buffer
+    def get_I2C_buffer_size(self):
+        """
+            Return the size of the TX buffer
 
-            if self.poll_for_write_complete == False:
-                time.sleep(self.page_write_time_ms / 1000) # Delay the amount of time to record a page
-            
-            # Need to hard-code this delay in because if code falls into the is_busy() call above
-            # error messages are printed to the command line when pinging the i2c address when it's busy
-            time.sleep(0.005)
+            :return: I2C_BUFFER_LENGTH_TX
+            :rtype: int
+        """
+        return self.I2C_BUFFER_LENGTH
+
+    # ------------------------------------------------------------------
+    # get_max_transfer_size()
+    #
+    # Return the largest single I2C message the bus driver can carry
+    def get_max_transfer_size(self):
+        """
+            Return the largest single I2C message the bus driver can carry.
+            Drivers that expose an I2C_RDWR capable bus start at the Linux
+            i2c-dev limit and shrink it the first time the adapter rejects
+            a message as too long. Other drivers are limited to the I2C
+            buffer size.
+
+            :return: maximum message length in bytes, including the two
+                EEPROM address bytes
+            :rtype: int
+        """
+        if self._max_transfer is None:
+            if self._rdwr_bus() is not None:
+                self._max_transfer = _I2C_RDWR_MAX_MSG_LEN
+            else:
+                self._max_transfer = self.I2C_BUFFER_LENGTH
+        return self._max_transfer
+
+    # ------------------------------------------------------------------
+    # _read_segment_size()
+    #
+    # Return the largest read message the bus driver can carry
+    def _read_segment_size(self):
+        """
+            Return the largest read message the bus driver can carry: the
+            transfer limit, lowered further if the adapter rejected reads.
+        """
+        if self._max_read_segment is None:
+            return self.get_max_transfer_size()
+        return min(self._max_read_segment, self.get_max_transfer_size())
+
+    # ------------------------------------------------------------------
+    # _rdwr_bus()
+    #
+    # Return the smbus2 bus behind the I2C driver, if there is one
+    def _rdwr_bus(self):
+        """
+            Return the smbus2 bus object behind the I2C driver, or None if
+            the driver can't do combined I2C_RDWR transfers.
+        """
+        bus = getattr(self._i2c, "i2cbus", None)
+        if bus is not None and hasattr(bus, "i2c_rdwr"):
+            return bus
+        return None
+
+    # ------------------------------------------------------------------
+    # _shrink_max_transfer(err, msg_length)
+    #
+    # Lower the transfer limit after the adapter rejected a message
+    def _shrink_max_transfer(self, err, msg_length):
+        """
+            Lower the transfer limit after the bus adapter rejected a message
+            of msg_length bytes.
+
+            :return: True if the limit was lowered and the transfer should be
+                retried, false if err was not a length rejection
+            :rtype: bool
+        """
+        if getattr(err, "errno", None) not in _TRANSFER_TOO_LONG_ERRNOS:
+            return False
+        if msg_length <= self.I2C_BUFFER_LENGTH:
+            return False
+        self._max_transfer = max(self.I2C_BUFFER_LENGTH, msg_length // 2)
+        return True
+
+    # ------------------------------------------------------------------
+    # _write_chunk(i2c_address, mem_address, chunk)
+    #
+    # Send one EEPROM write transaction: two address bytes then the data
+    @_bus_transaction
+    def _write_chunk(self, i2c_address, mem_address, chunk):
+        """
+            Send one write transaction to the EEPROM. The chunk must not
+            cross a page boundary.
+
+            :param i2c_address: I2C address to write to
+            :param mem_address: 16-bit memory address of the first byte
+            :param chunk: bytes-like object holding the data to write
+        """
+        eeprom_address_MSB = (mem_address >> 8) & 0xFF
+        eeprom_address_LSB = mem_address & 0xFF
+
+        bus = self._rdwr_bus()
+        if bus is not None:
+            # One I2C_RDWR message carries the whole page in a single transaction
+            message = bytearray(len(chunk) + 2)
+            message[0] = eeprom_address_MSB
+            message[1] = eeprom_address_LSB
+            message[2:] = chunk
+            bus.i2c_rdwr(_rdwr_write_msg(i2c_address, message))
+        else:
+            self._i2c.writeBlock(i2c_address, eeprom_address_MSB, [eeprom_address_LSB] + list(chunk))
+
+        self._write_started = time.monotonic()
+        self._write_nacked = None
+        if self._stats is not None:
+            self._stats.count("write_transactions")
+            self._stats.count("bytes_written", len(chunk))
+
+    # ------------------------------------------------------------------
+    # _probe(i2c_address)
+    #
+    # Address the EEPROM without sending data. It NACKs while a write cycle runs.
+    @_bus_transaction
+    def _probe(self, i2c_address):
+        """
+            Address the EEPROM through this object's I2C driver without
+            transferring any data: a zero-length I2C_RDWR write, or an SMBus
+            quick command if the adapter can't send zero-length messages.
+            Nothing is printed when the device NACKs.
+
+            :return: True if the device answered, false otherwise
+            :rtype: bool
+        """
+        bus = self._rdwr_bus()
+        try:
+            if bus is not None and self._zero_length_probe == True:
+                bus.i2c_rdwr(smbus2.i2c_msg(addr=i2c_address, flags=0, len=0, buf=None))
+                return True
+            if bus is not None and hasattr(bus, "write_quick"):
+                bus.write_quick(i2c_address)
+                return True
+            if hasattr(self._i2c, "isDeviceConnected"):
+                return self._i2c.isDeviceConnected(i2c_address)
+        except (IOError, OSError) as err:
+            if self._zero_length_probe == True and getattr(err, "errno", None) in _TRANSFER_TOO_LONG_ERRNOS:
+                # The adapter doesn't do zero-length messages; use quick commands from now on
+                self._zero_length_probe = False
+                return self._probe(i2c_address)
+            return False
+        return qwiic_i2c.isDeviceConnected(i2c_address)
+
+    # ------------------------------------------------------------------
+    # _wait_for_write_complete()
+    #
+    # Block until the write cycle started by the last write has finished
+    def _wait_for_write_complete(self):
+        """
+            Wait out the write cycle of the last write transaction, if any,
+            using the current write complete mode.
+        """
+        delay = self._write_complete_step()
+        while delay is not None:
+            if self._stats is not None:
+                started = time.monotonic()
+                time.sleep(delay)
+                self._stats.count("sleep_seconds", time.monotonic() - started)
+            else:
+                time.sleep(delay)
+            delay = self._write_complete_step()
+
+    # ------------------------------------------------------------------
+    # _write_complete_step()
+    #
+    # Check on the pending write cycle without blocking
+    @_synchronized
+    def _write_complete_step(self):
+        """
+            Take one step towards finishing the pending write cycle: probe
+            the device if it is time to, and say how long to sleep before
+            the next step. Shared by the blocking and asyncio code paths.
+
+            :return: None once the EEPROM is ready for the next transaction,
+                otherwise the number of seconds to sleep before stepping again
+            :rtype: float
+        """
+        if self._write_started is None:
+            return None
+
+        mode = self.write_complete_mode
+        elapsed = time.monotonic() - self._write_started
+        if mode == self.WRITE_COMPLETE_DELAY:
+            remaining = self.page_write_time_ms / 1000 - elapsed
+            if remaining > 0:
+                return remaining
+            self._write_started = None
+            return None
+
+        if mode == self.WRITE_COMPLETE_ADAPTIVE and self._write_nacked is None:
+            # Sleep until just before the write cycle is expected to end
+            remaining = self._adaptive_first_poll() - elapsed
+            if remaining > 0:
+                return remaining
+
+        ready = self._probe(self.address)
+        if self._stats is not None:
+            self._stats.count("polls")
+            if ready != True:
+                self._stats.count("busy_polls")
+        if ready == True:
+            self._learn_write_cycle(elapsed)
+            self._write_started = None
+            return None
+        if elapsed > self.poll_timeout_ms / 1000:
+            self._write_started = None
+            raise TimeoutError("EEPROM at 0x%02X did not finish its write cycle" % self.address)
+        self._write_nacked = elapsed
+        if mode == self.WRITE_COMPLETE_ADAPTIVE:
+            return self._adaptive_poll_spacing()
+        return self.poll_interval_ms / 1000
+
+    # ------------------------------------------------------------------
+    # _adaptive_first_poll()
+    #
+    # When to ACK-poll first in adaptive mode
+    def _adaptive_first_poll(self):
+        """
+            Return the time after a write to send the first ACK-poll: one
+            mean deviation before the learned write cycle time, or straight
+            away until there is a measurement.
+        """
+        if self._write_cycles == 0:
+            return 0
+        return max(self._write_cycle_mean - self._write_cycle_dev, 0)
+
+    # ------------------------------------------------------------------
+    # _adaptive_poll_spacing()
+    #
+    # Time between ACK-polls in adaptive mode
+    def _adaptive_poll_spacing(self):
+        """
+            Return the time between ACK-polls in adaptive mode: half the mean
+            deviation, so the expected end of the cycle is covered by a few
+            probes, kept between _ADAPTIVE_MIN_POLL_S and poll_interval_ms.
+        """
+        if self._write_cycles == 0:
+            return self.poll_interval_ms / 1000
+        spacing = max(self._write_cycle_dev / 2, self._ADAPTIVE_MIN_POLL_S)
+        return min(spacing, self.poll_interval_ms / 1000)
+
+    # ------------------------------------------------------------------
+    # _learn_write_cycle(elapsed)
+    #
+    # Update the write cycle statistics after a successful ACK-poll
+    def _learn_write_cycle(self, elapsed):
+        """
+            Fold the write cycle that just finished into the statistics.
+            elapsed is when the successful poll was sent. The cycle ended
+            between the last NACKed poll and then. If the first poll already
+            succeeded on schedule, the cycle ended earlier than expected, so
+            the estimate is pulled in by one poll spacing. A first poll sent
+            late tells us nothing.
+        """
+        spacing = self._adaptive_poll_spacing()
+        if self._write_nacked is not None:
+            sample = (self._write_nacked + elapsed) / 2
+        elif self._write_cycles and elapsed <= self._adaptive_first_poll() + spacing:
+            sample = max(elapsed - spacing, 0)
+        else:
+            return
+
+        if self._write_cycles == 0:
+            self._write_cycle_mean = sample
+            self._write_cycle_dev = sample / 4
+        else:
+            # Smoothed mean and mean deviation, weighted like TCP round trip estimates
+            error = sample - self._write_cycle_mean
+            self._write_cycle_mean = self._write_cycle_mean + error / 8
+            self._write_cycle_dev = self._write_cycle_dev + (abs(error) - self._write_cycle_dev) / 4
+        self._write_cycles = self._write_cycles + 1
+        if self._write_cycle_min is None or sample < self._write_cycle_min:
+            self._write_cycle_min = sample
+        if self._write_cycle_max is None or sample > self._write_cycle_max:
+            self._write_cycle_max = sample
+    
+    # ------------------------------------------------------------------
+    # read_byte(eeprom_location)
+    #
+    # Read a byte from a given EEPROM location
+    def read_byte(self, eeprom_location):
+        """
+            Read exactly one byte from EEPROM at a given address location
+            
+            :param eeprom_location: location in EEPROM to read byte from
+            :return: byte read from EEPROM
+            :rtype: byte
+        """
+        return self.read_bytes(eeprom_location, 1)[0]
+    
+    # ------------------------------------------------------------------
+    # read_int(eeprom_location)
+    # 
+    # Read a 32-bit signed int from a given EEPROM location
+    def read_int(self, eeprom_location, byteorder = "big"):
+        """
+            Read a 32-bit signed int from a given EEPROM location
+            
+            :param eeprom_location: location in EEPROM to read int from
+            :param byteorder: "big" (the default, as written by write_int()) or "little"
+            :return: int read from EEPROM
+            :rtype: int
+        """
+        return self.read_value(eeprom_location, "int32", byteorder)
+    
+    # ------------------------------------------------------------------
+    # read_float(eeprom_location)
+    #
+    # Read 32-bit float from given EEPROM location
+    def read_float(self, eeprom_location, byteorder = "little"):
+        """
+            Read a 32-bit float from a given EEPROM location
+            
+            :param eeprom_location: location in EEPROM to read float from 
+            :param byteorder: "little" (the default, as written by write_float()) or "big"
+            :return: float read from EEPROM
+            :rtype: float
+        """
+        return self.read_value(eeprom_location, "float32", byteorder)
+
+    # ------------------------------------------------------------------
+    # read_value(eeprom_location, dtype, byteorder)
+    #
+    # Read one fixed-width number from a given EEPROM location
+    def read_value(self, eeprom_location, dtype, byteorder = "little"):
+        """
+            Read one fixed-width number from a given EEPROM location
+            
+            :param eeprom_location: location in EEPROM to read the value from
+            :param dtype: "int8", "uint8", "int16", "uint16", "int32",
+                "uint32", "int64", "uint64", "float32" or "float64"
+            :param byteorder: "little" or "big", the byte order in EEPROM
+            :return: value read from EEPROM
+            :rtype: int or float
+        """
+        codec = _codec(dtype, byteorder)
+        return codec.unpack(self.read_bytes(eeprom_location, codec.size))[0]
+        
+    # ------------------------------------------------------------------
+    # read_string(eeprom_location, string_length)
+    #
+    # Read string of given length from EEPROM
+    def read_string(self, eeprom_location, string_length):
+        """
+            Read a stromg of given length from any address of EEPROM
+            
+            :param: eeprom_location: location in EEPROM to read string from
+            :param string_length: number of chars to read from EEPROM
+            :return: string read from EEPROM
+            :rtype: string
+        """
+        return self.read_bytes(eeprom_location, string_length).decode()
+
+    # ------------------------------------------------------------------
+    # read_array(eeprom_location, dtype, count, byteorder)
+    #
+    # Read an array of fixed-width numbers with one bulk read
+    def read_array(self, eeprom_location, dtype, count, byteorder = "little"):
+        """
+            Read count numbers of type dtype stored back to back, with one
+            bulk read straight into the array's memory. The result supports
+            the buffer protocol, so numpy.frombuffer() can use it without a
+            copy.
+
+            :param eeprom_location: location in EEPROM to read the array from
+            :param dtype: "int8", "uint8", "int16", "uint16", "int32",
+                "uint32", "int64", "uint64", "float32" or "float64" (a NumPy
+                dtype or scalar type of those names works too)
+            :param count: number of values to read
+            :param byteorder: "little" or "big", the byte order in EEPROM
+            :return: the values read
+            :rtype: array.array
+        """
+        _check_byteorder(byteorder)
+        typecode = _array_typecode(dtype)
+        values = array.array(typecode, bytes(count * array.array(typecode).itemsize))
+        self.read_into(eeprom_location, values)
+        if byteorder != sys.byteorder:
+            values.byteswap()
+        return values
+    
+    # ------------------------------------------------------------------
+    # read(eeprom_location, amt_to_read)
+    #
+    # Bulk read from EEPROM, returned as a list of ints.
+    def read(self, eeprom_location, num_bytes):
+        """
+            Bulk read from EEPROM.
+            Uses sequential reads as large as the bus driver allows (see
+            read_into())
+            Handles a read that straddles the 512kbit barrier
+            
+            :param eeprom_location: address of EEPROM to start reading from
+            :param num_bytes: number of bytes to be read from external EEPROM
+            :return: a list of bytes read from EEPROM
+            :rtype: list
+        """
+        return list(self.read_bytes(eeprom_location, num_bytes))
+
+    # ------------------------------------------------------------------
+    # read_bytes(eeprom_location, num_bytes)
+    #
+    # Bulk read from EEPROM into a new bytearray
+    def read_bytes(self, eeprom_location, num_bytes):
+        """
+            Bulk read from EEPROM into a new bytearray
+            
+            :param eeprom_location: address of EEPROM to start reading from
+            :param num_bytes: number of bytes to be read from external EEPROM
+            :return: the bytes read from EEPROM, fewer than num_bytes if the
+                read runs past the end of the EEPROM
+            :rtype: bytearray
+        """
+        data = bytearray(num_bytes)
+        del data[self.read_into(eeprom_location, data):]
+        return data
+
+    # ------------------------------------------------------------------
+    # read_into(eeprom_location, buffer)
+    #
+    # Bulk read from EEPROM straight into a caller supplied buffer.
+    # On Linux a read is one address write followed by a stream of large
+    # sequential read messages; other drivers read in I2C buffer sized chunks
+    # (can be overidden with set_I2C_buffer_size()).
+    # Handles a read that straddles the 512kbit barrier    
+    @_synchronized
+    def read_into(self, eeprom_location, buffer):
+        """
+            Bulk read from EEPROM straight into a writable buffer (bytearray,
+            memoryview, array, ...), filling all of it, or as much as fits
+            before the end of the EEPROM. On Linux the bus
+            driver writes the data directly into the buffer, without
+            building per-byte Python objects.
+
+            The EEPROM auto-increments its address on sequential reads, so
+            on Linux the address is written once and the data is streamed
+            back in read messages of up to get_max_transfer_size() bytes,
+            as many as fit in one I2C_RDWR transfer. Other drivers read in
+            I2C buffer sized chunks.
+            
+            :param eeprom_location: address of EEPROM to start reading from
+            :param buffer: writable bytes-like object to fill
+            :return: number of bytes read
+            :rtype: int
+        """
+        view = memoryview(buffer).cast("B")
+        if view.readonly:
+            raise TypeError("read_into() needs a writable buffer")
+
+        # Error check
+        if eeprom_location < 0:
+            raise ValueError("EEPROM location %d is negative" % eeprom_location)
+        if eeprom_location + len(view) > self.memory_size_bytes:
+            view = view[:max(self.memory_size_bytes - eeprom_location, 0)]
+        if len(view) == 0:
+            return 0
+        stats = self._stats
+        if stats is not None:
+            started = time.perf_counter()
+
+        self._read_stored_into(eeprom_location, view)
+
+        # Queued writes are newer than what the EEPROM holds
+        if self._write_queue is not None:
+            self._write_queue.overlay(eeprom_location, view)
+
+        # Writes still held in the write cache are newer than what the EEPROM holds
+        if self._write_cache:
+            _overlay_pages(self._write_cache, self.page_size_bytes, eeprom_location, view)
+
+        if stats is not None:
+            stats.observe("read", time.perf_counter() - started)
+        return len(view)
+
+    # ------------------------------------------------------------------
+    # readv(requests, max_gap)
+    #
+    # Read many scattered ranges with as few sequential reads as possible
+    @_synchronized
+    def readv(self, requests, max_gap = 32):
+        """
+            Read many (location, length) ranges at once. The ranges are
+            sorted, and ranges that overlap, touch or are at most max_gap
+            bytes apart are merged, so each group costs one sequential read
+            instead of an address write and read per range. Reading a few
+            unwanted bytes is cheaper than another transaction.
+
+                (version, name, gain) = my_eeprom.readv([(0, 4), (64, 16), (8, 4)])
+                gain = struct.unpack(">f", gain)[0]
+
+            :param requests: sequence of (location, length) pairs
+            :param max_gap: largest gap in bytes between two ranges that are still merged
+            :return: one memoryview per request, in request order, over
+                the buffer of its merged read. Like read_bytes(), a range
+                that runs past the end of the EEPROM comes back short.
+            :rtype: list
+        """
+        for location, length in requests:
+            if location < 0 or length < 0:
+                raise ValueError("readv() ranges need a non-negative location and length")
+
+        results = [None] * len(requests)
+        order = sorted(range(len(requests)), key=lambda index: requests[index][0])
+
+        group = []
+        group_start = group_end = 0
+        for index in order + [None]:
+            if index is not None:
+                location, length = requests[index]
+                if group and location <= group_end + max_gap:
+                    group.append(index)
+                    group_end = max(group_end, location + length)
+                    continue
+
+            # Read the finished group and hand out views of it
+            if group:
+                data = memoryview(bytearray(group_end - group_start))
+                data = data[:self.read_into(group_start, data)]
+                for member in group:
+                    member_start = requests[member][0] - group_start
+                    results[member] = data[member_start:member_start + requests[member][1]]
+
+            if index is not None:
+                group = [index]
+                group_start, group_end = location, location + length
+        return results
+
+    # ------------------------------------------------------------------
+    # _read_stored_into(eeprom_location, view)
+    #
+    # Read what the EEPROM holds, through the read cache if it is enabled
+    def _read_stored_into(self, eeprom_location, view):
+        """
+            Read what the EEPROM holds into view, through the read cache if
+            it is enabled. Data still in the write cache or queue is not
+            included.
+        """
+        # Out of range reads fail the same way whether or not they would be cached
+        if eeprom_location < 0 or eeprom_location + len(view) > self.memory_size_bytes:
+            raise ValueError("Read of %d bytes at %d is outside the EEPROM" % (len(view), eeprom_location))
+        if self._read_cache is not None:
+            self._cached_read_into(eeprom_location, view)
+        else:
+            self._read_device_into(eeprom_location, view)
+
+    # ------------------------------------------------------------------
+    # _read_device_into(eeprom_location, view)
+    #
+    # Read from the EEPROM itself, bypassing the caches
+    def _read_device_into(self, eeprom_location, view):
+        """
+            Read len(view) bytes from the EEPROM into view, a writable byte
+            memoryview, in as few bus transfers as possible.
+        """
+        num_bytes = len(view)
+        streaming = self._rdwr_bus() is not None
+        received = 0
+
+        while received < num_bytes:
+
+            # Limit the amount to read to what one bus transfer can carry
+            amt_to_read = num_bytes - received
+            max_read_size = self._read_segment_size()
+            if streaming:
+                max_read_size = max_read_size * (self._max_read_msgs - 1)
+            if amt_to_read > max_read_size:
+                amt_to_read = max_read_size
+            
+            # Large (>512kbit) EEPROMs are addressed in 64kB blocks; one transfer can't cross a block
+            i2c_address, block_remaining = self._block_address(eeprom_location + received)
+            if amt_to_read > block_remaining:
+                amt_to_read = block_remaining
+
+            # Make sure EEPROM isn't still writing a previous request
+            self._wait_for_write_complete()
+            
+            try:
+                self._read_chunk_into(i2c_address, eeprom_location + received, view[received:received + amt_to_read])
+            except (IOError, OSError) as err:
+                # The adapter rejected the transfer. Retry with a single read message
+                # first, as many adapters take no more, then with shorter ones
+                if getattr(err, "errno", None) not in _TRANSFER_TOO_LONG_ERRNOS:
+                    raise
+                if streaming and self._max_read_msgs > 2:
+                    self._max_read_msgs = 2
+                    continue
+                segment = min(amt_to_read, self._read_segment_size())
+                if segment > self.I2C_BUFFER_LENGTH:
+                    self._max_read_segment = max(self.I2C_BUFFER_LENGTH, segment // 2)
+                    continue
+                raise
+            
+            received = received + amt_to_read
+
+    # ------------------------------------------------------------------
+    # _cached_read_into(eeprom_location, view)
+    #
+    # Serve a read from the read cache, filling missing pages from the EEPROM
+    def _cached_read_into(self, eeprom_location, view):
+        """
+            Fill view from the read cache. Pages that aren't cached are read
+            from the EEPROM with one sequential read and added to the cache.
+        """
+        if len(view) == 0:
+            return
+
+        page_size = self.page_size_bytes
+        cache = self._read_cache
+        first_page = eeprom_location // page_size
+        last_page = (eeprom_location + len(view) - 1) // page_size
+
+        missing = [page_number for page_number in range(first_page, last_page + 1) if page_number not in cache]
+        self._read_cache_misses += len(missing)
+        self._read_cache_hits += last_page - first_page + 1 - len(missing)
+
+        if missing:
+            start = missing[0] * page_size
+            end = min((missing[-1] + 1) * page_size, self.memory_size_bytes)
+            data = bytearray(end - start)
+            self._read_device_into(start, memoryview(data))
+            for page_number in missing:
+                offset = page_number * page_size - start
+                cache[page_number] = data[offset:offset + page_size]
+
+        read_end = eeprom_location + len(view)
+        for page_number in range(first_page, last_page + 1):
+            page = cache[page_number]
+            cache.move_to_end(page_number)
+            page_address = page_number * page_size
+            start = max(page_address, eeprom_location)
+            end = min(page_address + len(page), read_end)
+            view[start - eeprom_location:end - eeprom_location] = page[start - page_address:end - page_address]
+
+        while len(cache) * page_size > self._read_cache_bytes:
+            cache.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # _update_read_cache(eeprom_location, data)
+    #
+    # Keep cached pages in step with data just written to the EEPROM
+    def _update_read_cache(self, eeprom_location, data):
+        """
+            Copy data (which must not cross a page boundary) into the cached
+            page it belongs to, if that page is cached.
+        """
+        page_number, offset = divmod(eeprom_location, self.page_size_bytes)
+        page = self._read_cache.get(page_number)
+        if page is not None:
+            page[offset:offset + len(data)] = data
+
+    # ------------------------------------------------------------------
+    # _block_address(eeprom_location)
+    #
+    # Map a memory location to the I2C address of its 64kB block
+    def _block_address(self, eeprom_location):
+        """
+            Return (I2C address, bytes left in the block) for eeprom_location.
+            EEPROMs larger than 512kbit only take 16 bit memory addresses and
+            select each 64kB block with bits of the I2C address.
+        """
+        if self.memory_size_bytes <= 0x10000:
+            return self.address, 0x10000 - (eeprom_location & 0xFFFF)
+        block = eeprom_location >> 16
+        return self.address | (block << self.block_select_shift), 0x10000 - (eeprom_location & 0xFFFF)
+
+    # ------------------------------------------------------------------
+    # _read_chunk_into(i2c_address, mem_address, view)
+    #
+    # Send one EEPROM read transfer: address write, repeated start, then
+    # one or more sequential read messages
+    @_bus_transaction
+    def _read_chunk_into(self, i2c_address, mem_address, view):
+        """
+            Read len(view) bytes starting at mem_address into view, a
+            writable byte memoryview. On Linux the read is split into
+            messages of _read_segment_size() bytes, all sent in one
+            I2C_RDWR transfer after a single address write.
+        """
+        eeprom_address_MSB = (mem_address >> 8) & 0xFF
+        eeprom_address_LSB = mem_address & 0xFF
+
+        bus = self._rdwr_bus()
+        if bus is not None:
+            msgs = [_rdwr_write_msg(i2c_address, bytearray((eeprom_address_MSB, eeprom_address_LSB)))]
+            segment = self._read_segment_size()
+            for start in range(0, len(view), segment):
+                msgs.append(_rdwr_read_msg(i2c_address, view[start:start + segment]))
+            bus.i2c_rdwr(*msgs)
+        else:
+            view[:] = bytes(self._i2c.__i2c_rdwr__(i2c_address, [eeprom_address_MSB, eeprom_address_LSB], len(view)))
+
+        if self._stats is not None:
+            self._stats.count("read_transactions")
+            self._stats.count("bytes_read", len(view))
+        
+    # ------------------------------------------------------------------
+    # write_byte(eeprom_location, byte_to_write)
+    #
+    # Write a single byte to a given EEPROM location
+    def write_byte(self, eeprom_location, byte_to_write):
+        """
+            Write a single byte to given EEPROM location
+
+            :param eeprom_location: location in EEPROM to byte to 
+            :param byte_to_write: byte to write to EEPROM
+            :return: Nothing
+            :rtype: Void
+        """
+        return self.write_value(eeprom_location, byte_to_write, "uint8")
+    
+    # ------------------------------------------------------------------
+    # write_int()
+    #
+    # Write a signed 32-bit int to a given EEPROM location
+    def write_int(self, eeprom_location, int_to_write, byteorder = "big"):
+        """
+            Write a signed 32-bit int to a given EEPROM location
+            
+            :param eeprom_location: location in EEPROM to write int to 
+            :param int_to_write: int to write to EEPROM
+            :param byteorder: "big" (the default) or "little"
+            :return: Nothing
+            :rtype: Void
+        """
+        return self.write_value(eeprom_location, int_to_write, "int32", byteorder)
+    
+    # ------------------------------------------------------------------
+    # write_float()
+    #
+    # Write a 32-bit float to a given EEPROM location
+    def write_float(self, eeprom_location, float_to_write, byteorder = "little"):
+        """
+            Write a 32-bit float to a given EEPROM location
+            
+            :param eeprom_location: location in EEPROM to write float to 
+            :param float_to_write: float to write to EEPROM
+            :param byteorder: "little" (the default) or "big"
+            :return: Nothing
+            :rtype: Void
+        """
+        return self.write_value(eeprom_location, float_to_write, "float32", byteorder)
+
+    # ------------------------------------------------------------------
+    # write_value(eeprom_location, value, dtype, byteorder)
+    #
+    # Write one fixed-width number to a given EEPROM location
+    def write_value(self, eeprom_location, value, dtype, byteorder = "little"):
+        """
+            Write one fixed-width number to a given EEPROM location
+            
+            :param eeprom_location: location in EEPROM to write the value to
+            :param value: int or float to write to EEPROM
+            :param dtype: type to store the value as, see read_value()
+            :param byteorder: "little" or "big", the byte order in EEPROM
+            :return: Nothing
+            :rtype: Void
+        """
+        return self.write(eeprom_location, _codec(dtype, byteorder).pack(value))
+    
+    # ------------------------------------------------------------------
+    # write_string()
+    #
+    # Write a string to a given EEPROM location
+    def write_string(self, eeprom_location, string_to_write):
+        """
+            Write a stirng to a given EEPROM location
+            
+            :param eeprom_location: location in EEPROM to write string to
+            :param string_to_write: string to write to EEPROM
+            :return: Nothing
+            :rtype: Void
+        """
+        # Encode string to ASCII representation
+        self.write(eeprom_location, string_to_write.encode())
+
+    # ------------------------------------------------------------------
+    # write_array(eeprom_location, values, dtype, byteorder)
+    #
+    # Write an array of fixed-width numbers with one bulk write
+    def write_array(self, eeprom_location, values, dtype = None, byteorder = "little"):
+        """
+            Write numbers back to back as fixed-width values, encoded in one
+            go and programmed with full page writes.
+
+            :param eeprom_location: location in EEPROM to write the array to
+            :param values: an array.array, a NumPy array, or a sequence of numbers
+            :param dtype: type to store the values as, see read_array().
+                Defaults to the type of an array.array or NumPy array.
+            :param byteorder: "little" or "big", the byte order in EEPROM
+            :return: Nothing, or a Future while the write queue is enabled
+            :rtype: Void
+        """
+        return self.write(eeprom_location, self._encode_array(values, dtype, byteorder))
+
+    # ------------------------------------------------------------------
+    # _encode_array(values, dtype, byteorder)
+    #
+    # Turn numbers into the bytes write_array() stores
+    def _encode_array(self, values, dtype, byteorder):
+        """
+            Return the bytes of values as dtype in the given byte order.
+            NumPy arrays are converted with their own methods, so NumPy is
+            never imported here.
+        """
+        _check_byteorder(byteorder)
+        if hasattr(values, "dtype") and hasattr(values, "astype"):
+            typecode = _array_typecode(values.dtype if dtype is None else dtype)
+            # NumPy type string such as "<f4"
+            kind = "f" if typecode in "fd" else ("i" if typecode.islower() else "u")
+            numpy_type = ("<" if byteorder == "little" else ">") + kind + str(array.array(typecode).itemsize)
+            return values.astype(numpy_type, copy=False).tobytes()
+
+        if dtype is None:
+            if not isinstance(values, array.array):
+                raise ValueError("write_array() needs a dtype for %s values" % type(values).__name__)
+            typecode = values.typecode
+        else:
+            typecode = _array_typecode(dtype)
+        encoded = array.array(typecode, values)
+        if byteorder != sys.byteorder:
+            encoded.byteswap()
+        return encoded
+        
+    # ------------------------------------------------------------------
+    # write
+    #
+    # Write large bulk amounts to EEPROM. Each transaction carries as much of
+    # a page as the bus driver allows (a full page on Linux).
+    def write(self, eeprom_location, data_list):
+        """
+            Write large bulk amounts to EEPROM. Writes are split at page
+            boundaries and each piece is sent as a single transaction, up to
+            the largest message the bus driver can carry (see
+            get_max_transfer_size()). Returns once the last transaction is
+            sent; its write cycle is waited out before the next access (see
+            set_write_complete_mode()).
+
+            With enable_skip_unchanged_writes() the target span is read
+            first and only the part of each page that differs is written.
+            With enable_write_cache() the data is held in the cache until
+            flush(). With enable_write_queue() the data is queued for the
+            writer thread and a Future for it is returned.
+            
+            :param eeprom_location: 2-byte EEPROM address to write to 
+            :param data_list: data bytes to be written to EEPROM sequentially,
+                starting at the EEPROM address. A list of ints or any
+                bytes-like object (bytes, bytearray, memoryview)
+            :rtype: Void
+            :return: nothing
+        """
+        data = _byte_view(data_list)
+        buffer_size = len(data)
+        
+        # Error check
+        if eeprom_location + buffer_size >= self.memory_size_bytes:
+            buffer_size = self.memory_size_bytes - eeprom_location
+        if buffer_size <= 0:
+            return
+        data = data[:buffer_size]
+        stats = self._stats
+        if stats is not None:
+            started = time.perf_counter()
+
+        # Queueing may block until the writer thread catches up, so it must not hold the device lock
+        future = None
+        if self._write_queue is not None:
+            future = self._write_queue.submit(eeprom_location, data)
+        else:
+            self._store(eeprom_location, data)
+
+        if stats is not None:
+            stats.observe("write", time.perf_counter() - started)
+        return future
+
+    # ------------------------------------------------------------------
+    # _store(eeprom_location, data)
+    #
+    # Write through the write cache, or straight to the EEPROM
+    @_synchronized
+    def _store(self, eeprom_location, data):
+        """
+            Hand data (a byte memoryview) to the write cache, or program it
+            if the cache is disabled.
+        """
+        if self._write_cache is not None:
+            self._cache_write(eeprom_location, data)
+        else:
+            self._write_through(eeprom_location, data)
+
+    # ------------------------------------------------------------------
+    # _write_through(eeprom_location, data)
+    #
+    # Program data now, skipping unchanged bytes if that mode is enabled
+    def _write_through(self, eeprom_location, data):
+        """
+            Program data (a byte memoryview) starting at eeprom_location,
+            bypassing the write cache.
+        """
+        buffer_size = len(data)
+
+        if self.skip_unchanged_writes == False:
+            self._write_span(eeprom_location, data)
+            return
+
+        # Compare against what the EEPROM actually holds, not the cached or queued data
+        # being programmed, and program only the changed part of each page
+        current = memoryview(bytearray(buffer_size))
+        self._read_stored_into(eeprom_location, current)
+        start = 0
+        while start < buffer_size:
+            end = start + self.page_size_bytes - (eeprom_location + start) % self.page_size_bytes
+            if end > buffer_size:
+                end = buffer_size
+            changed = _changed_span(current[start:end], data[start:end])
+            if changed is not None:
+                self._write_span(eeprom_location + start + changed[0], data[start + changed[0]:start + changed[1]])
+            start = end
+
+    # ------------------------------------------------------------------
+    # _write_span(eeprom_location, data)
+    #
+    # Program a span of EEPROM, one page-bounded transaction at a time
+    def _write_span(self, eeprom_location, data):
+        """
+            Program data (a byte memoryview) starting at eeprom_location,
+            splitting it at page boundaries and at the bus transfer limit.
+        """
+        buffer_size = len(data)
+
+        # Break the buffer into page sized chunks
+        recorded = 0
+        while recorded < buffer_size:
+            
+            # Limit the amount to write to either the page size or the bus driver limit
+            max_write_size = self.page_size_bytes
+            if max_write_size > self.get_max_transfer_size() - 2:
+                max_write_size = self.get_max_transfer_size() - 2 # We loose two bytes to the EEPROM address
+
+            amt_to_write = buffer_size - recorded
+            if amt_to_write > max_write_size:
+                amt_to_write = max_write_size
+            
+            # Writes cannot cross a page line. Limit the write amt to go right up to edge of page barrier
+            page_remaining = self.page_size_bytes - (eeprom_location + recorded) % self.page_size_bytes
+            if amt_to_write > page_remaining:
+                amt_to_write = page_remaining
+                    
+            # Pages never straddle a 64kB block, so only the block's I2C address is needed
+            i2c_address = self._block_address(eeprom_location + recorded)[0]
+
+            # Make sure EEPROM isn't still writing a previous request
+            self._wait_for_write_complete()
+            
+            # Now, set up the full write
+            try:
+                self._write_chunk(i2c_address, eeprom_location + recorded, data[recorded:recorded + amt_to_write])
+            except (IOError, OSError) as err:
+                # The adapter can't carry a message this long; retry with a smaller one
+                if self._shrink_max_transfer(err, amt_to_write + 2):
+                    continue
+                raise
+
+            if self._read_cache is not None:
+                self._update_read_cache(eeprom_location + recorded, data[recorded:recorded + amt_to_write])
+                
+            # Increment "recorded" counter
+            recorded = recorded + amt_to_write
+
+    # ------------------------------------------------------------------
+    # flush()
+    #
+    # Program everything held in the write cache and wait for it to finish
+    def flush(self):
+        """
+            Program every dirty page held in the write cache, in address
+            order, wait for the write queue to drain, and wait for the last
+            write cycle to finish. The EEPROM
+            object is also a context manager that flushes on exit:
+
+                with my_eeprom:
+                    my_eeprom.write_int(0, 1)
+                    my_eeprom.write_int(4, 2)
+
+            :return: Nothing
+            :rtype: Void
+        """
+        stats = self._stats
+        if stats is not None:
+            started = time.perf_counter()
+        self._flush_write_cache()
+        self.wait()
+        self._wait_for_write_complete()
+        if stats is not None:
+            stats.observe("flush", time.perf_counter() - started)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
+        return False
+
+    # ------------------------------------------------------------------
+    # open(mode, buffering, start, length)
+    #
+    # Open the EEPROM as a binary file
+    def open(self, mode = "rb", buffering = -1, start = 0, length = None):
+        """
+            Open the EEPROM, or the region [start, start + length), as a
+            binary file, for shutil.copyfileobj(), pickle and the like:
+
+                with my_eeprom.open("wb") as f:
+                    pickle.dump(settings, f)
+
+            The file has no end-of-data marker: reading runs to the end of
+            the region, so whatever follows the data (0xFF on an erased
+            EEPROM) is read back too. pickle stops at its own end marker,
+            but json, gzip and most other formats need the exact length,
+            for example from a header written in front of the data:
+
+                blob = gzip.compress(json.dumps(settings).encode())
+                with my_eeprom.open("wb") as f:
+                    f.write(struct.pack(">I", len(blob)) + blob)
+                with my_eeprom.open("rb") as f:
+                    size = struct.unpack(">I", f.read(4))[0]
+                    settings = json.loads(gzip.decompress(f.read(size)))
+
+            The buffer is a whole number of pages, so full buffers are
+            programmed with full page writes. Closing the file flushes it
+            and the EEPROM.
+
+            :param mode: "rb", "wb" or "r+b". Writing never truncates.
+            :param buffering: 0 for an unbuffered EEPROMRawIO, otherwise the
+                buffer size, rounded up to whole pages. Defaults to
+                io.DEFAULT_BUFFER_SIZE rounded up to whole pages.
+            :param start: EEPROM address of the file's first byte
+            :param length: size of the file, defaults to the rest of the EEPROM
+            :return: io.BufferedReader, io.BufferedWriter or io.BufferedRandom
+            :rtype: Object
+        """
+        raw = EEPROMRawIO(self, mode, start, length)
+        if buffering == 0:
+            return raw
+        if buffering < 0:
+            buffering = io.DEFAULT_BUFFER_SIZE
+        buffer_size = -(-buffering // self.page_size_bytes) * self.page_size_bytes
+        if raw.readable() and raw.writable():
+            return io.BufferedRandom(raw, buffer_size)
+        if raw.writable():
+            return io.BufferedWriter(raw, buffer_size)
+        return io.BufferedReader(raw, buffer_size)
+
+    # ------------------------------------------------------------------
+    # _flush_write_cache()
+    #
+    # Program every cached page, without waiting for the last write cycle
+    @_synchronized
+    def _flush_write_cache(self):
+        """
+            Program every dirty page held in the write cache, in address order
+        """
+        if self._write_cache:
+            for page_number in sorted(self._write_cache):
+                self._flush_page(page_number, self._write_cache.pop(page_number))
+
+    # ------------------------------------------------------------------
+    # _cache_write(eeprom_location, data)
+    #
+    # Merge a write into the write-back cache
+    def _cache_write(self, eeprom_location, data):
+        """
+            Copy data (a byte memoryview) into the cached pages it covers,
+            then evict pages if the cache is over its size.
+        """
+        _merge_into_pages(self._write_cache, self.page_size_bytes, eeprom_location, data)
+        self._evict_write_cache()
+
+    # ------------------------------------------------------------------
+    # _evict_write_cache()
+    #
+    # Program least recently used pages until the cache is back to size
+    def _evict_write_cache(self):
+        """
+            Program least recently used pages until the cache is back within
+            its page budget.
+        """
+        while len(self._write_cache) > self._write_cache_pages:
+            page_number, page = self._write_cache.popitem(last=False)
+            self._flush_page(page_number, page)
+
+    # ------------------------------------------------------------------
+    # _flush_page(page_number, page)
+    #
+    # Program the dirty part of one cached page with a single write
+    def _flush_page(self, page_number, page):
+        """
+            Program the dirty bytes of a cached page. Gaps between dirty
+            spans are filled from the EEPROM first, so the page costs one
+            write cycle however many separate writes went into it.
+        """
+        page_address = page_number * self.page_size_bytes
+        start = page.spans[0][0]
+        end = page.spans[-1][1]
+        data = page.data
+        if len(page.spans) > 1:
+            dirty = bytes(data)
+            self._read_device_into(page_address + start, memoryview(data)[start:end])
+            for span_start, span_end in page.spans:
+                data[span_start:span_end] = dirty[span_start:span_end]
+        self._write_through(page_address + start, memoryview(data)[start:end])
+
+class QwiicEEPROMArray(object):
+    """
+    Several Qwiic EEPROMs presented as one linear address space.
+
+    CONCATENATE puts the chips one after another. STRIPE interleaves them a
+    page at a time (page 0 on the first chip, page 1 on the second, ...), so
+    a long write programs one chip while the previous one is still in its
+    write cycle, multiplying sustained write throughput by the number of
+    chips. Striping needs every chip to have the same page size.
+
+        :param eeproms: QwiicEEPROM objects to combine, in order. If not
+                        provided one is created for each address.
+        :param addresses: I2C addresses of the chips, used when eeproms
+                        isn't provided. Defaults to all eight EEPROM addresses.
+        :param i2c_driver: An existing i2c driver object, shared by the chips
+                        created from addresses.
+        :param layout: QwiicEEPROMArray.STRIPE or QwiicEEPROMArray.CONCATENATE
+        :return: The QwiicEEPROMArray object.
+        :rtype: Object
+    """
+    CONCATENATE = 0
+    STRIPE = 1
+
+    def __init__(self, eeproms=None, addresses=None, i2c_driver=None, layout=STRIPE):
+        if eeproms is None:
+            if addresses is None:
+                addresses = _AVAILABLE_I2C_ADDRESS
+            if i2c_driver is None:
+                i2c_driver = qwiic_i2c.getI2CDriver()
+            eeproms = [QwiicEEPROM(address, i2c_driver) for address in addresses]
+        if len(eeproms) == 0:
+            raise ValueError("A QwiicEEPROMArray needs at least one EEPROM")
+        if layout == self.STRIPE and len(set(eeprom.page_size_bytes for eeprom in eeproms)) > 1:
+            raise ValueError("Striped EEPROMs must all have the same page size")
+
+        self.eeproms = list(eeproms)
+        self.layout = layout
+
+    # ------------------------------------------------------------------
+    # begin()
+    #
+    # Initialize the system and validate every board.
+    def begin(self):
+        """
+            Initialize the operation of every EEPROM in the array.
+
+            :return: Returns true if every EEPROM is connected, false otherwise.
+            :rtype: bool
+        """
+        return all(eeprom.begin() for eeprom in self.eeproms)
+
+    # ------------------------------------------------------------------
+    # is_connected()
+    #
+    # Are all the boards connected to our system?
+    def is_connected(self):
+        """
+            Determine if every EEPROM in the array is connected to the system
+
+            :return: True if every EEPROM is connected, false otherwise.
+            :rtype: bool
+        """
+        return all(eeprom.is_connected() for eeprom in self.eeproms)
+
+    # ------------------------------------------------------------------
+    # length()
+    #
+    # Returns the memory size of the whole array
+    def length(self):
+        """
+            Returns the memory size of the whole array in bytes. A striped
+            array is limited by its smallest chip.
+
+            :return: memory size in bytes
+            :rtype: int
+        """
+        if self.layout == self.STRIPE:
+            return len(self.eeproms) * int(min(eeprom.length() for eeprom in self.eeproms))
+        return sum(int(eeprom.length()) for eeprom in self.eeproms)
+
+    # ------------------------------------------------------------------
+    # get_page_size()
+    #
+    # Return the stripe size of the array
+    def get_page_size(self):
+        """
+            Return the page size of the chips (the first chip's when the
+            array is concatenated)
+
+            :return: page size in bytes
+            :rtype: int
+        """
+        return self.eeproms[0].page_size_bytes
+
+    # ------------------------------------------------------------------
+    # _runs(location, num_bytes)
+    #
+    # Split an array range into runs that are contiguous on one chip
+    def _runs(self, location, num_bytes):
+        """
+            Yield (chip index, chip address, offset into the range, length)
+            for each piece of [location, location + num_bytes) that is
+            contiguous on one chip, in array address order.
+        """
+        offset = 0
+        while offset < num_bytes:
+            address = location + offset
+            if self.layout == self.STRIPE:
+                stripe_size = self.eeproms[0].page_size_bytes
+                stripe, within = divmod(address, stripe_size)
+                chip_index = stripe % len(self.eeproms)
+                chip_address = (stripe // len(self.eeproms)) * stripe_size + within
+                run = stripe_size - within
+            else:
+                chip_index = 0
+                chip_address = address
+                while chip_address >= self.eeproms[chip_index].length():
+                    chip_address = chip_address - int(self.eeproms[chip_index].length())
+                    chip_index = chip_index + 1
+                    if chip_index == len(self.eeproms):
+                        return
+                run = int(self.eeproms[chip_index].length()) - chip_address
+            run = min(run, num_bytes - offset)
+            yield chip_index, chip_address, offset, run
+            offset = offset + run
+
+    # ------------------------------------------------------------------
+    # _chip_ranges(location, num_bytes)
+    #
+    # Group the runs of an array range by chip
+    def _chip_ranges(self, location, num_bytes):
+        """
+            Return {chip index: [runs]} for [location, location + num_bytes).
+            The runs on each chip are contiguous in that chip's address space.
+        """
+        chip_runs = {}
+        for run in self._runs(location, num_bytes):
+            chip_runs.setdefault(run[0], []).append(run)
+        return chip_runs
+
+    # ------------------------------------------------------------------
+    # read(location, num_bytes)
+    #
+    # Bulk read from the array, returned as a list of ints
+    def read(self, location, num_bytes):
+        """
+            Bulk read from the array
+
+            :param location: array address to start reading from
+            :param num_bytes: number of bytes to read
+            :return: a list of bytes read
+            :rtype: list
+        """
+        return list(self.read_bytes(location, num_bytes))
+
+    # ------------------------------------------------------------------
+    # read_bytes(location, num_bytes)
+    #
+    # Bulk read from the array into a new bytearray
+    def read_bytes(self, location, num_bytes):
+        """
+            Bulk read from the array into a new bytearray
+
+            :param location: array address to start reading from
+            :param num_bytes: number of bytes to read
+            :return: the bytes read
+            :rtype: bytearray
+        """
+        data = bytearray(num_bytes)
+        self.read_into(location, data)
+        return data
+
+    # ------------------------------------------------------------------
+    # read_into(location, buffer)
+    #
+    # Bulk read from the array into a caller supplied buffer
+    def read_into(self, location, buffer):
+        """
+            Bulk read from the array into a writable buffer. Each chip is
+            read with one sequential read covering all of its part of the
+            range, which is then scattered into place.
+
+            :param location: array address to start reading from
+            :param buffer: writable bytes-like object to fill
+            :return: number of bytes read
+            :rtype: int
+        """
+        view = memoryview(buffer).cast("B")
+        for chip_index, runs in self._chip_ranges(location, len(view)).items():
+            eeprom = self.eeproms[chip_index]
+            if len(runs) == 1:
+                _, chip_address, offset, run = runs[0]
+                eeprom.read_into(chip_address, view[offset:offset + run])
+                continue
+            chip_start = runs[0][1]
+            chip_data = memoryview(eeprom.read_bytes(chip_start, runs[-1][1] + runs[-1][3] - chip_start))
+            for _, chip_address, offset, run in runs:
+                view[offset:offset + run] = chip_data[chip_address - chip_start:chip_address - chip_start + run]
+        return len(view)
+
+    # ------------------------------------------------------------------
+    # write(location, data_list)
+    #
+    # Write to the array in address order, moving from chip to chip
+    def write(self, location, data_list):
+        """
+            Write bulk amounts to the array. Pieces are written in address
+            order; with striping each page goes to the next chip, whose
+            write cycle overlaps the following chips' transfers.
+
+            :param location: array address to write to
+            :param data_list: list of ints or bytes-like object to write
+            :return: Nothing
+            :rtype: Void
+        """
+        data = _byte_view(data_list)
+        for chip_index, chip_address, offset, run in self._runs(location, len(data)):
+            self.eeproms[chip_index].write(chip_address, data[offset:offset + run])
+
+    # ------------------------------------------------------------------
+    # erase(to_write, start, end, skip_blank)
+    #
+    # Erase the array, going round the chips a page at a time
+    def erase(self, to_write = 0x00, start = 0, end = None, skip_blank = False):
+        """
+            Erase the whole array, or the range [start, end). The chips are
+            erased a page at a time in turn, so their write cycles overlap
+            whatever the layout.
+
+            :param to_write: byte to write into each spot
+            :param start: first array address to erase
+            :param end: array address after the last one to erase
+            :param skip_blank: leave pages that already hold only to_write untouched
+            :return: Nothing
+            :rtype: Void
+        """
+        if end is None or end > self.length():
+            end = self.length()
+        if start >= end:
+            return
+
+        # Contiguous [next, end) range left to erase on each chip
+        remaining = []
+        for chip_index, runs in self._chip_ranges(start, end - start).items():
+            remaining.append([self.eeproms[chip_index], runs[0][1], runs[-1][1] + runs[-1][3]])
+
+        while remaining:
+            for chip_range in list(remaining):
+                eeprom, chip_start, chip_end = chip_range
+                page_end = min(chip_start - chip_start % eeprom.page_size_bytes + eeprom.page_size_bytes, chip_end)
+                eeprom.erase(to_write, chip_start, page_end, skip_blank)
+                chip_range[1] = page_end
+                if page_end >= chip_end:
+                    remaining.remove(chip_range)
+
+    # ------------------------------------------------------------------
+    # enable_read_cache(max_bytes)
+    #
+    # Turn on every chip's read cache
+    def enable_read_cache(self, max_bytes = 4096):
+        """
+            Turn on the read cache of every EEPROM in the array, see
+            QwiicEEPROM.enable_read_cache()
+
+            :param max_bytes: size of each chip's cache in bytes
+            :return: Nothing
+            :rtype: Void
+        """
+        for eeprom in self.eeproms:
+            eeprom.enable_read_cache(max_bytes)
+
+    # ------------------------------------------------------------------
+    # flush()
+    #
+    # Flush every chip
+    def flush(self):
+        """
+            Flush every EEPROM in the array, see QwiicEEPROM.flush()
+
+            :return: Nothing
+            :rtype: Void
+        """
+        for eeprom in self.eeproms:
+            eeprom.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
+        return False
+
+class EEPROMView(object):
+    """
+    A bytearray/mmap-like window onto a QwiicEEPROM or QwiicEEPROMArray.
+    Indexing, slicing and slice assignment go through the bulk read and
+    write paths, so code written against a bytearray works unchanged:
+
+        view = EEPROMView(my_eeprom)
+        header = view[0:16]
+        view[16:20] = b"\x01\x02\x03\x04"
+
+        :param eeprom: the QwiicEEPROM or QwiicEEPROMArray to view
+        :param start: EEPROM address of the view's first byte
+        :param length: number of bytes in the view, defaults to the rest of the EEPROM
+        :param cache_bytes: if given, turn on the EEPROM's read cache with this many bytes
+        :return: The EEPROMView object.
+        :rtype: Object
+    """
+    # Bytes per read when iterating, unless chunks() is given a size
+    CHUNK_SIZE = 4096
+
+    def __init__(self, eeprom, start=0, length=None, cache_bytes=None):
+        size = int(eeprom.length())
+        if length is None:
+            length = size - start
+        if start < 0 or length < 0 or start + length > size:
+            raise ValueError("View [%d, %d) is outside the EEPROM" % (start, start + length))
+
+        self.eeprom = eeprom
+        self.start = start
+        self._length = length
+        if cache_bytes is not None:
+            eeprom.enable_read_cache(cache_bytes)
+
+    def __len__(self):
+        return self._length
+
+    def _index(self, index):
+        """
+            Return the EEPROM address of an int index, negative indexes
+            counting from the end like a bytearray
+        """
+        if index < 0:
+            index = index + self._length
+        if index < 0 or index >= self._length:
+            raise IndexError("EEPROMView index out of range")
+        return self.start + index
+
+    def __getitem__(self, index):
+        """
+            view[i] returns an int, view[a:b] and view[a:b:step] return bytes
+        """
+        if isinstance(index, slice):
+            first, stop, step = index.indices(self._length)
+            if step == 1:
+                return bytes(self.eeprom.read_bytes(self.start + first, max(stop - first, 0)))
+            span = range(first, stop, step)
+            if len(span) == 0:
+                return b""
+            low, high = min(span[0], span[-1]), max(span[0], span[-1])
+            return bytes(self.eeprom.read_bytes(self.start + low, high - low + 1)[span[0] - low::step])
+        return self.eeprom.read_bytes(self._index(index), 1)[0]
+
+    def __setitem__(self, index, value):
+        """
+            view[i] = int, and view[a:b] = data with len(data) == b - a.
+            Extended slices are read, patched and written back as one span.
+        """
+        if not isinstance(index, slice):
+            self.eeprom.write(self._index(index), bytes((value,)))
+            return
+
+        data = _byte_view(value)
+        first, stop, step = index.indices(self._length)
+        span = range(first, stop, step)
+        if len(data) != len(span):
+            raise IndexError("EEPROMView slice assignment is wrong size")
+        if len(span) == 0:
+            return
+        if step == 1:
+            self.eeprom.write(self.start + first, data)
+            return
+        low, high = min(span[0], span[-1]), max(span[0], span[-1])
+        patched = self.eeprom.read_bytes(self.start + low, high - low + 1)
+        patched[span[0] - low::step] = data
+        self.eeprom.write(self.start + low, patched)
+
+    def __iter__(self):
+        """
+            Iterate over the bytes as ints, reading CHUNK_SIZE bytes at a time
+        """
+        for chunk in self.chunks():
+            for byte in chunk:
+                yield byte
+
+    def chunks(self, chunk_size=None):
+        """
+            Iterate over the view in bytearray chunks, each read with one
+            bulk read. Chunks after the first start on a chunk_size boundary
+            of EEPROM addresses, so page aligned sizes keep reads aligned.
+
+            :param chunk_size: bytes per chunk, defaults to CHUNK_SIZE
+            :return: generator of bytearray
+        """
+        chunk_size = chunk_size or self.CHUNK_SIZE
+        location = self.start
+        end = self.start + self._length
+        while location < end:
+            amt_to_read = min(chunk_size - location % chunk_size, end - location)
+            yield self.eeprom.read_bytes(location, amt_to_read)
+            location = location + amt_to_read
+
+    def read_into(self, offset, buffer):
+        """
+            Fill a writable buffer from the view, starting at offset
+
+            :return: number of bytes read
+            :rtype: int
+        """
+        view = memoryview(buffer).cast("B")
+        if offset < 0 or offset + len(view) > self._length:
+            raise IndexError("EEPROMView read out of range")
+        return self.eeprom.read_into(self.start + offset, view)
+
+    def tobytes(self):
+        """
+            Return the whole view as bytes, read with one bulk read
+        """
+        return bytes(self.eeprom.read_bytes(self.start, self._length))
+
+    def __bytes__(self):
+        return self.tobytes()
+
+    def __buffer__(self, flags):
+        """
+            Buffer protocol (Python 3.12+): a read-only snapshot of the view,
+            so memoryview(view), struct.unpack_from() and friends work
+        """
+        return memoryview(self.tobytes())
+
+    def flush(self):
+        """
+            Flush the EEPROM, see QwiicEEPROM.flush()
+        """
+        self.eeprom.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
+        return False
+
+class EEPROMRawIO(io.RawIOBase):
+    """
+    Unbuffered binary stream over a region of a QwiicEEPROM, usually made
+    with QwiicEEPROM.open(). Reads and writes go straight to the bulk read
+    and page-splitting write paths. The stream can't grow: writes stop at
+    the end of the region.
+
+        :param eeprom: the QwiicEEPROM (or QwiicEEPROMArray) to stream
+        :param mode: "rb", "wb" or "r+b"
+        :param start: EEPROM address of the stream's first byte
+        :param length: size of the stream, defaults to the rest of the EEPROM
+        :return: The EEPROMRawIO object.
+        :rtype: Object
+    """
+    def __init__(self, eeprom, mode="rb", start=0, length=None):
+        super(EEPROMRawIO, self).__init__()
+        modes = set(mode)
+        if modes - set("rwb+") or len(mode) != len(modes) or len(modes & set("rw")) != 1:
+            raise ValueError("Invalid mode: %r" % (mode,))
+        size = int(eeprom.length())
+        if length is None:
+            length = size - start
+        if start < 0 or length < 0 or start + length > size:
+            raise ValueError("Stream [%d, %d) is outside the EEPROM" % (start, start + length))
+
+        self.eeprom = eeprom
+        self.mode = mode
+        self.start = start
+        self.length = length
+        self._readable = "r" in modes or "+" in modes
+        self._writable = "w" in modes or "+" in modes
+        self._position = 0
+
+    def readable(self):
+        return self._readable
+
+    def writable(self):
+        return self._writable
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        """
+            Read up to len(buffer) bytes into buffer with one bulk read
+
+            :return: number of bytes read, 0 at the end of the stream
+            :rtype: int
+        """
+        self._checkClosed()
+        if not self._readable:
+            raise io.UnsupportedOperation("File not open for reading")
+        view = memoryview(buffer).cast("B")
+        amt_to_read = max(min(len(view), self.length - self._position), 0)
+        self.eeprom.read_into(self.start + self._position, view[:amt_to_read])
+        self._position = self._position + amt_to_read
+        return amt_to_read
+
+    def readall(self):
+        """
+            Read the rest of the stream with one bulk read
+        """
+        data = bytearray(max(self.length - self._position, 0))
+        return bytes(data[:self.readinto(data)])
+
+    def write(self, data):
+        """
+            Write as much of data as fits before the end of the stream
+
+            :return: number of bytes written
+            :rtype: int
+        """
+        self._checkClosed()
+        if not self._writable:
+            raise io.UnsupportedOperation("File not open for writing")
+        view = _byte_view(data)
+        amt_to_write = min(len(view), self.length - self._position)
+        if amt_to_write <= 0 and len(view) > 0:
+            raise OSError(errno.ENOSPC, "No space left in the EEPROM stream")
+        self.eeprom.write(self.start + self._position, view[:amt_to_write])
+        self._position = self._position + amt_to_write
+        return amt_to_write
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        """
+            Move to offset from the start, the current position or the end
+
+            :return: the new position
+            :rtype: int
+        """
+        self._checkClosed()
+        if whence == io.SEEK_CUR:
+            offset = offset + self._position
+        elif whence == io.SEEK_END:
+            offset = offset + self.length
+        elif whence != io.SEEK_SET:
+            raise ValueError("Invalid whence (%r)" % (whence,))
+        if offset < 0:
+            raise ValueError("Negative seek position %d" % offset)
+        self._position = offset
+        return offset
+
+    def tell(self):
+        self._checkClosed()
+        return self._position
+
+    def flush(self):
+        """
+            Flush the EEPROM as well, so written data is programmed
+        """
+        super(EEPROMRawIO, self).flush()
+        if self._writable:
+            self.eeprom.flush()
+
+class AsyncQwiicEEPROM(object):
+    """
+    asyncio front end for a Qwiic EEPROM. Bus transactions run in an
+    executor and write cycles are waited out with asyncio.sleep(), so the
+    event loop keeps running while the EEPROM programs a page. Operations
+    on one object run one at a time.
+
+        :param eeprom: An existing QwiicEEPROM object. If not provided one is
+                        created from address and i2c_driver.
+        :param address: The I2C address to use for the device.
+        :param i2c_driver: An existing i2c driver object.
+        :param executor: concurrent.futures executor for bus transactions.
+                        If not provided the event loop's default executor is used.
+        :return: The AsyncQwiicEEPROM object.
+        :rtype: Object
+    """
+    def __init__(self, eeprom=None, address=None, i2c_driver=None, executor=None):
+        if eeprom is None:
+            eeprom = QwiicEEPROM(address, i2c_driver)
+        self.eeprom = eeprom
+        self._executor = executor
+        self._lock = None
+
+    # ------------------------------------------------------------------
+    # _run(func, *args)
+    #
+    # Run a blocking EEPROM call in the executor
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    # ------------------------------------------------------------------
+    # _get_lock()
+    #
+    # The lock is created lazily so it belongs to the running event loop
+    def _get_lock(self):
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    # ------------------------------------------------------------------
+    # _wait_for_write_complete()
+    #
+    # Wait out a pending write cycle without blocking the event loop
+    async def _wait_for_write_complete(self):
+        delay = await self._run(self.eeprom._write_complete_step)
+        while delay is not None:
+            stats = self.eeprom._stats
+            if stats is not None:
+                started = time.monotonic()
+                await asyncio.sleep(delay)
+                stats.count("sleep_seconds", time.monotonic() - started)
+            else:
+                await asyncio.sleep(delay)
+            delay = await self._run(self.eeprom._write_complete_step)
+
+    # ------------------------------------------------------------------
+    # _call(func, *args)
+    #
+    # Wait for the EEPROM to be ready, then run one blocking call
+    async def _call(self, func, *args):
+        async with self._get_lock():
+            await self._wait_for_write_complete()
+            return await self._run(func, *args)
+
+    # ------------------------------------------------------------------
+    # begin()
+    #
+    # Initialize the system and validate the board.
+    async def begin(self):
+        """
+            Initialize the operation of the Qwiic EEPROM.
+
+            :return: Returns true if the initialization was successful, false otherwise.
+            :rtype: bool
+        """
+        return await self._call(self.eeprom.begin)
+
+    # ------------------------------------------------------------------
+    # read(eeprom_location, num_bytes)
+    #
+    # Bulk read from EEPROM, returned as a list of ints
+    async def read(self, eeprom_location, num_bytes):
+        """
+            Bulk read from EEPROM, see QwiicEEPROM.read()
+
+            :return: a list of bytes read from EEPROM
+            :rtype: list
+        """
+        return await self._call(self.eeprom.read, eeprom_location, num_bytes)
+
+    # ------------------------------------------------------------------
+    # read_bytes(eeprom_location, num_bytes)
+    #
+    # Bulk read from EEPROM into a new bytearray
+    async def read_bytes(self, eeprom_location, num_bytes):
+        """
+            Bulk read from EEPROM into a new bytearray, see QwiicEEPROM.read_bytes()
+
+            :return: the bytes read from EEPROM
+            :rtype: bytearray
+        """
+        return await self._call(self.eeprom.read_bytes, eeprom_location, num_bytes)
+
+    # ------------------------------------------------------------------
+    # read_into(eeprom_location, buffer)
+    #
+    # Bulk read from EEPROM into a caller supplied buffer
+    async def read_into(self, eeprom_location, buffer):
+        """
+            Bulk read from EEPROM into a writable buffer, see QwiicEEPROM.read_into()
+
+            :return: number of bytes read
+            :rtype: int
+        """
+        return await self._call(self.eeprom.read_into, eeprom_location, buffer)
+
+    async def read_byte(self, eeprom_location):
+        """
+            Read exactly one byte from EEPROM, see QwiicEEPROM.read_byte()
+        """
+        return await self._call(self.eeprom.read_byte, eeprom_location)
+
+    async def read_int(self, eeprom_location, byteorder = "big"):
+        """
+            Read a 32-bit signed int from EEPROM, see QwiicEEPROM.read_int()
+        """
+        return await self._call(self.eeprom.read_int, eeprom_location, byteorder)
+
+    async def read_float(self, eeprom_location, byteorder = "little"):
+        """
+            Read a 32-bit float from EEPROM, see QwiicEEPROM.read_float()
+        """
+        return await self._call(self.eeprom.read_float, eeprom_location, byteorder)
+
+    async def read_value(self, eeprom_location, dtype, byteorder = "little"):
+        """
+            Read one fixed-width number from EEPROM, see QwiicEEPROM.read_value()
+        """
+        return await self._call(self.eeprom.read_value, eeprom_location, dtype, byteorder)
+
+    async def read_string(self, eeprom_location, string_length):
+        """
+            Read a string from EEPROM, see QwiicEEPROM.read_string()
+        """
+        return await self._call(self.eeprom.read_string, eeprom_location, string_length)
+
+    async def readv(self, requests, max_gap = 32):
+        """
+            Read many scattered ranges at once, see QwiicEEPROM.readv()
+        """
+        return await self._call(self.eeprom.readv, requests, max_gap)
+
+    async def read_array(self, eeprom_location, dtype, count, byteorder = "little"):
+        """
+            Read an array of numbers from EEPROM, see QwiicEEPROM.read_array()
+        """
+        return await self._call(self.eeprom.read_array, eeprom_location, dtype, count, byteorder)
+
+    # ------------------------------------------------------------------
+    # write(eeprom_location, data_list)
+    #
+    # Write to EEPROM one page at a time, waiting for each page with asyncio.sleep()
+    async def write(self, eeprom_location, data_list):
+        """
+            Write bulk amounts to EEPROM, see QwiicEEPROM.write(). Each page
+            is sent from the executor and its write cycle is waited out on
+            the event loop.
+
+            :param eeprom_location: EEPROM address to write to
+            :param data_list: list of ints or bytes-like object to write
+            :return: Nothing
+            :rtype: Void
+        """
+        data = _byte_view(data_list)
+        page_size = self.eeprom.page_size_bytes
+        written = 0
+        while written < len(data):
+            amt_to_write = min(page_size - (eeprom_location + written) % page_size, len(data) - written)
+            await self._call(self.eeprom.write, eeprom_location + written, data[written:written + amt_to_write])
+            written = written + amt_to_write
+
+    async def write_byte(self, eeprom_location, byte_to_write):
+        """
+            Write a single byte to EEPROM, see QwiicEEPROM.write_byte()
+        """
+        await self._call(self.eeprom.write_byte, eeprom_location, byte_to_write)
+
+    async def write_int(self, eeprom_location, int_to_write, byteorder = "big"):
+        """
+            Write a signed 32-bit int to EEPROM, see QwiicEEPROM.write_int()
+        """
+        await self._call(self.eeprom.write_int, eeprom_location, int_to_write, byteorder)
+
+    async def write_float(self, eeprom_location, float_to_write, byteorder = "little"):
+        """
+            Write a 32-bit float to EEPROM, see QwiicEEPROM.write_float()
+        """
+        await self._call(self.eeprom.write_float, eeprom_location, float_to_write, byteorder)
+
+    async def write_value(self, eeprom_location, value, dtype, byteorder = "little"):
+        """
+            Write one fixed-width number to EEPROM, see QwiicEEPROM.write_value()
+        """
+        await self._call(self.eeprom.write_value, eeprom_location, value, dtype, byteorder)
+
+    async def write_string(self, eeprom_location, string_to_write):
+        """
+            Write a string to EEPROM, see QwiicEEPROM.write_string()
+        """
+        await self.write(eeprom_location, string_to_write.encode())
+
+    async def write_array(self, eeprom_location, values, dtype = None, byteorder = "little"):
+        """
+            Write an array of numbers to EEPROM, see QwiicEEPROM.write_array()
+        """
+        await self.write(eeprom_location, self.eeprom._encode_array(values, dtype, byteorder))
+
+    # ------------------------------------------------------------------
+    # erase(to_write, start, end, skip_blank)
+    #
+    # Erase the EEPROM one page at a time, waiting for each page with asyncio.sleep()
+    async def erase(self, to_write = 0x00, start = 0, end = None, skip_blank = False):
+        """
+            Erase entire EEPROM, or the range [start, end), see QwiicEEPROM.erase()
+
+            :return: Nothing
+            :rtype: Void
+        """
+        if end is None or end > self.eeprom.length():
+            end = int(self.eeprom.length())
+        page_size = self.eeprom.page_size_bytes
+        addr = start
+        while addr < end:
+            page_end = min(addr - addr % page_size + page_size, end)
+            await self._call(self.eeprom.erase, to_write, addr, page_end, skip_blank)
+            addr = page_end
+
+    # ------------------------------------------------------------------
+    # flush()
+    #
+    # Program the write cache, drain the write queue and wait for the last write cycle
+    async def flush(self):
+        """
+            Program everything held in the write cache, wait for the write
+            queue to drain, see QwiicEEPROM.flush(), and wait for the last
+            write cycle to finish.
+
+            :return: Nothing
+            :rtype: Void
+        """
+        async with self._get_lock():
+            await self._wait_for_write_complete()
+            await self._run(self.eeprom._flush_write_cache)
+            await self._run(self.eeprom.wait)
+            await self._wait_for_write_complete()
+
+    # ------------------------------------------------------------------
+    # wait()
+    #
+    # Wait until every queued write has been programmed
+    async def wait(self):
+        """
+            Wait until every write handed to the write queue has been
+            programmed, see QwiicEEPROM.wait()
+
+            :return: Nothing
+            :rtype: Void
+        """
+        await self._run(self.eeprom.wait)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.flush()
+        return False
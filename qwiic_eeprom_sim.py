@@ -0,0 +1,547 @@
+#-----------------------------------------------------------------------
+# qwiic_eeprom_sim.py
+#
+# Simulated EEPROM bus and bus tracing for testing and benchmarking
+# qwiic_eeprom without hardware.
+#
+#-----------------------------------------------------------------------
+#
+# This python library supports the SparkFun Electroncis qwiic 
+# qwiic sensor/board ecosystem 
+#
+# More information on qwiic is at https:// www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#=======================================================================
+# Copyright (c) 2020 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining 
+# a copy of this software and associated documentation files (the 
+# "Software"), to deal in the Software without restriction, including 
+# without limitation the rights to use, copy, modify, merge, publish, 
+# distribute, sublicense, and/or sell copies of the Software, and to 
+# permit persons to whom the Software is furnished to do so, subject to 
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be 
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF 
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. 
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY 
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, 
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE 
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#=======================================================================
+
+"""
+qwiic_eeprom_sim
+================
+Test and benchmark tooling for qwiic_eeprom: an in-memory EEPROM that
+stands in for the qwiic_i2c driver, and a driver wrapper that traces bus
+traffic for export and replay. It is kept out of qwiic_eeprom so the
+runtime module doesn't load it.
+"""
+# ----------------------------------------------------------------------
+
+import collections
+import ctypes
+import errno
+import json
+import struct
+import threading
+import time
+import qwiic_i2c
+import smbus2
+from qwiic_eeprom import _AVAILABLE_I2C_ADDRESS, _I2C_RDWR_MAX_MSG_LEN, _I2C_RDWR_MAX_MSGS, _I2C_M_RD
+
+class SimulatedEEPROMDriver(object):
+    """
+    An in-memory 24xx-series EEPROM that stands in for a qwiic_i2c driver,
+    so QwiicEEPROM can be exercised and benchmarked without hardware:
+
+        driver = SimulatedEEPROMDriver()
+        my_eeprom = QwiicEEPROM(i2c_driver=driver)
+
+    It answers I2C_RDWR transfers (driver.i2cbus.i2c_rdwr()) and SMBus
+    quick commands like the Linux driver does, and models:
+    - the internal address pointer, kept across transfers
+    - page wrap-around of writes that run past the end of a page
+    - memory address wrap-around, and 64kB block select through the I2C address
+    - NACKs to every transfer during the write cycle after a write
+    - bus clock timing: each transfer takes as long as it would on the bus
+    - adapter limits on message length and messages per transfer
+
+    Counters: transfers (probes included), probes (transfers that carry
+    no data, such as ACK-polls), messages, bytes_written, bytes_read,
+    nacks, write_cycles and bus_time_s.
+
+        :param memory_size: memory size in bytes
+        :param page_size: page size in bytes
+        :param write_time_ms: write cycle time (tWR) in milliseconds
+        :param address: base I2C address of the EEPROM
+        :param block_select_shift: I2C address bit that selects the 64kB block
+        :param clock_hz: I2C bus clock
+        :param max_transfer: longest message the adapter accepts, in bytes
+        :param max_msgs: most messages the adapter accepts in one transfer
+        :param realtime: spend each transfer's bus time for real. If False
+                        the time is only added up in bus_time_s.
+        :return: The SimulatedEEPROMDriver object.
+        :rtype: Object
+    """
+    def __init__(self, memory_size=65536, page_size=128, write_time_ms=5, address=_AVAILABLE_I2C_ADDRESS[0],
+                 block_select_shift=2, clock_hz=400000, max_transfer=_I2C_RDWR_MAX_MSG_LEN,
+                 max_msgs=_I2C_RDWR_MAX_MSGS, realtime=True):
+        self.memory = bytearray(b"\xff" * memory_size)
+        self.page_size = page_size
+        self.write_time_ms = write_time_ms
+        self.address = address
+        self.block_select_shift = block_select_shift
+        self.clock_hz = clock_hz
+        self.max_transfer = max_transfer
+        self.max_msgs = max_msgs
+        self.realtime = realtime
+
+        self._block_size = min(memory_size, 0x10000)
+        self._blocks = max(memory_size // 0x10000, 1)
+        self._pointer = 0
+        self._busy_until = 0
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    @property
+    def i2cbus(self):
+        """
+            The simulated smbus2 SMBus, which is the driver itself
+        """
+        return self
+
+    def reset_stats(self):
+        """
+            Zero the transfer counters
+        """
+        self.transfers = 0
+        self.messages = 0
+        self.bytes_written = 0
+        self.bytes_read = 0
+        self.nacks = 0
+        self.probes = 0
+        self.write_cycles = 0
+        self.bus_time_s = 0.0
+
+    def _block(self, i2c_address):
+        """
+            Return the 64kB block i2c_address selects, or None if the
+            address isn't the EEPROM's
+        """
+        block_mask = (self._blocks - 1) << self.block_select_shift
+        if i2c_address & ~block_mask != self.address:
+            return None
+        return (i2c_address & block_mask) >> self.block_select_shift
+
+    def _spend(self, bits):
+        """
+            Account for bits clocked on the bus, waiting them out in realtime mode
+        """
+        seconds = bits / self.clock_hz
+        self.bus_time_s = self.bus_time_s + seconds
+        if self.realtime:
+            deadline = time.perf_counter() + seconds
+            if seconds > 0.002:
+                time.sleep(seconds - 0.001)
+            while time.perf_counter() < deadline:
+                pass
+
+    def _acknowledge(self, i2c_address):
+        """
+            Address the EEPROM: 9 bits on the bus, then a NACK (raised as
+            EREMOTEIO, like the Linux driver) if it isn't there or is busy
+        """
+        self._spend(9)
+        block = self._block(i2c_address)
+        if block is None or time.monotonic() < self._busy_until:
+            self.nacks = self.nacks + 1
+            raise OSError(errno.EREMOTEIO, "Remote I/O error")
+        return block
+
+    def i2c_rdwr(self, *msgs):
+        """
+            Run an I2C_RDWR transfer of smbus2 i2c_msg messages, with a
+            repeated start between messages and a stop at the end
+        """
+        if len(msgs) > self.max_msgs:
+            raise OSError(errno.EINVAL, "Invalid argument")
+        for msg in msgs:
+            if msg.len > self.max_transfer:
+                raise OSError(errno.EOPNOTSUPP, "Operation not supported")
+
+        with self._lock:
+            self.transfers = self.transfers + 1
+            self._spend(2)  # Start and stop
+            if all(msg.len == 0 for msg in msgs):
+                self.probes = self.probes + 1
+            programmed = False
+            for msg in msgs:
+                self.messages = self.messages + 1
+                block = self._acknowledge(msg.addr)
+                if msg.flags & _I2C_M_RD:
+                    self._read(block, msg)
+                else:
+                    programmed = self._write(block, ctypes.string_at(msg.buf, msg.len)) or programmed
+
+            # The write cycle starts at the stop condition
+            if programmed:
+                self.write_cycles = self.write_cycles + 1
+                self._busy_until = time.monotonic() + self.write_time_ms / 1000
+
+    def _read(self, block, msg):
+        """
+            Sequential read from the address pointer, wrapping at the end of the block
+        """
+        self._spend(9 * msg.len)
+        location = self._pointer
+        data = bytearray(msg.len)
+        copied = 0
+        while copied < msg.len:
+            amt_to_copy = min(msg.len - copied, self._block_size - location)
+            start = block * self._block_size + location
+            data[copied:copied + amt_to_copy] = self.memory[start:start + amt_to_copy]
+            copied = copied + amt_to_copy
+            location = (location + amt_to_copy) % self._block_size
+        ctypes.memmove(msg.buf, bytes(data), msg.len)
+        self._pointer = location
+        self.bytes_read = self.bytes_read + msg.len
+
+    def _write(self, block, data):
+        """
+            Set the address pointer from the first two bytes and program the
+            rest into the page, wrapping at the end of the page
+
+            :return: True if any data was programmed
+        """
+        self._spend(9 * len(data))
+        self.bytes_written = self.bytes_written + len(data)
+        if len(data) < 2:
+            return False
+
+        self._pointer = ((data[0] << 8) | data[1]) % self._block_size
+        if len(data) == 2:
+            return False
+        page_start = self._pointer - self._pointer % self.page_size
+        offset = self._pointer - page_start
+        base = block * self._block_size + page_start
+        for byte in data[2:]:
+            self.memory[base + offset] = byte
+            offset = (offset + 1) % self.page_size
+        self._pointer = (page_start + offset) % self._block_size
+        return True
+
+    def write_quick(self, i2c_address):
+        """
+            SMBus quick command: address the EEPROM with no data
+        """
+        with self._lock:
+            self.transfers = self.transfers + 1
+            self.probes = self.probes + 1
+            self.messages = self.messages + 1
+            self._spend(2)
+            self._acknowledge(i2c_address)
+
+    # ------------------------------------------------------------------
+    # qwiic_i2c driver methods
+    def isDeviceConnected(self, devAddr):
+        try:
+            self.write_quick(devAddr)
+            return True
+        except (IOError, OSError):
+            return False
+
+    def writeBlock(self, address, commandCode, value):
+        self.i2c_rdwr(smbus2.i2c_msg.write(address, [commandCode] + list(value)))
+
+# Kinds of bus call in a trace
+TRACE_READ = 0          # I2C_RDWR transfer with read messages
+TRACE_WRITE = 1         # I2C_RDWR transfer with only write messages
+TRACE_PROBE = 2         # I2C_RDWR transfer of zero-length messages (ACK-poll)
+TRACE_QUICK = 3         # SMBus quick command
+TRACE_WRITE_BLOCK = 4   # qwiic_i2c writeBlock()
+TRACE_RDWR_CALL = 5     # qwiic_i2c __i2c_rdwr__()
+TRACE_CONNECTED = 6     # qwiic_i2c isDeviceConnected()
+
+_TRACE_KIND_NAMES = ("read", "write", "probe", "quick", "writeBlock", "__i2c_rdwr__", "isDeviceConnected")
+
+# No memory address in a trace record
+TRACE_NO_ADDRESS = 0xFFFFFFFF
+
+# Binary trace record: start (ns since the trace started), duration (ns), memory
+# address, write bytes, read bytes, messages, kind, I2C address, errno (0 for success)
+_TRACE_RECORD = struct.Struct("<qIIIIHBBB")
+
+TraceRecord = collections.namedtuple("TraceRecord", ("start_ns", "duration_ns", "mem_address", "write_bytes",
+                                                     "read_bytes", "messages", "kind", "i2c_address", "errno"))
+
+def iter_trace_records(data):
+    """
+        Decode trace records from the bytes of TracingI2CDriver.to_bytes()
+
+        :param data: bytes-like object of packed records
+        :return: generator of TraceRecord
+    """
+    for fields in _TRACE_RECORD.iter_unpack(data):
+        yield TraceRecord(*fields)
+
+class _TracingSMBus(object):
+    """
+        The smbus2 bus of a traced driver: I2C_RDWR transfers and quick
+        commands are recorded, everything else is passed through
+    """
+    def __init__(self, tracer, bus):
+        self._tracer = tracer
+        self._bus = bus
+
+    def __getattr__(self, name):
+        return getattr(self._bus, name)
+
+    def i2c_rdwr(self, *msgs):
+        write_bytes = read_bytes = 0
+        mem_address = TRACE_NO_ADDRESS
+        for msg in msgs:
+            if msg.flags & _I2C_M_RD:
+                read_bytes = read_bytes + msg.len
+            else:
+                if mem_address == TRACE_NO_ADDRESS and msg.len >= 2:
+                    address_bytes = ctypes.string_at(msg.buf, 2)
+                    mem_address = (address_bytes[0] << 8) | address_bytes[1]
+                write_bytes = write_bytes + msg.len
+        if read_bytes:
+            kind = TRACE_READ
+        elif write_bytes:
+            kind = TRACE_WRITE
+        else:
+            kind = TRACE_PROBE
+        address = msgs[0].addr if msgs else 0
+        return self._tracer._traced(kind, address, mem_address, write_bytes, read_bytes, len(msgs),
+                                    self._bus.i2c_rdwr, *msgs)
+
+    def write_quick(self, i2c_addr, *args, **kwargs):
+        return self._tracer._traced(TRACE_QUICK, i2c_addr, TRACE_NO_ADDRESS, 0, 0, 0,
+                                    self._bus.write_quick, i2c_addr, *args, **kwargs)
+
+class TracingI2CDriver(object):
+    """
+    Wraps a qwiic_i2c driver and records every bus call QwiicEEPROM makes
+    through it into a ring buffer of compact binary records: start time,
+    duration, I2C address, memory address and payload sizes, and the error
+    if the call failed. Payload contents are not kept.
+
+        tracer = TracingI2CDriver(qwiic_i2c.getI2CDriver())
+        my_eeprom = QwiicEEPROM(i2c_driver=tracer)
+        ...
+        tracer.export_chrome_trace("eeprom_trace.json")
+
+    The trace opens in chrome://tracing or Perfetto, and replay_trace()
+    runs it against a SimulatedEEPROMDriver to try other settings offline.
+
+        :param i2c_driver: the driver to trace. If not provided a driver
+                        object is created.
+        :param capacity: number of records kept, older ones are overwritten
+        :return: The TracingI2CDriver object.
+        :rtype: Object
+    """
+    def __init__(self, i2c_driver=None, capacity=65536):
+        if i2c_driver is None:
+            i2c_driver = qwiic_i2c.getI2CDriver()
+        self._driver = i2c_driver
+        self._trace_lock = threading.Lock()
+        self._buffer = bytearray(capacity * _TRACE_RECORD.size)
+        self.capacity = capacity
+        self.clear()
+
+        bus = getattr(i2c_driver, "i2cbus", None)
+        self._bus = None if bus is None else _TracingSMBus(self, bus)
+
+    def __getattr__(self, name):
+        # Everything not traced, such as the bus number, comes from the wrapped driver
+        if name == "_driver":
+            raise AttributeError(name)
+        return getattr(self._driver, name)
+
+    @property
+    def i2cbus(self):
+        """
+            The traced smbus2 bus of the wrapped driver
+        """
+        if self._bus is None:
+            raise AttributeError("i2cbus")
+        return self._bus
+
+    def clear(self):
+        """
+            Drop every record and restart the trace clock
+        """
+        with self._trace_lock:
+            self._next = 0
+            self._count = 0
+            self.dropped = 0
+            self._origin_ns = time.perf_counter_ns()
+
+    def __len__(self):
+        return self._count
+
+    def _traced(self, kind, i2c_address, mem_address, write_bytes, read_bytes, messages, func, *args, **kwargs):
+        """
+            Call func(*args, **kwargs) and record it
+        """
+        started = time.perf_counter_ns()
+        error = 0
+        try:
+            result = func(*args, **kwargs)
+            if kind == TRACE_CONNECTED and not result:
+                error = errno.ENXIO
+            return result
+        except (IOError, OSError) as err:
+            error = err.errno or 0xFF
+            raise
+        finally:
+            self._record(started, time.perf_counter_ns() - started, mem_address, write_bytes, read_bytes,
+                         messages, kind, i2c_address, error)
+
+    def _record(self, started, duration, mem_address, write_bytes, read_bytes, messages, kind, i2c_address, error):
+        with self._trace_lock:
+            _TRACE_RECORD.pack_into(self._buffer, self._next * _TRACE_RECORD.size, started - self._origin_ns,
+                                    min(duration, 0xFFFFFFFF), mem_address, write_bytes, read_bytes,
+                                    min(messages, 0xFFFF), kind, i2c_address & 0xFF, min(error, 0xFF))
+            self._next = (self._next + 1) % self.capacity
+            if self._count == self.capacity:
+                self.dropped = self.dropped + 1
+            else:
+                self._count = self._count + 1
+
+    # ------------------------------------------------------------------
+    # qwiic_i2c driver methods used by QwiicEEPROM
+    def writeBlock(self, address, commandCode, value):
+        return self._traced(TRACE_WRITE_BLOCK, address, (commandCode << 8) | (value[0] if value else 0),
+                            1 + len(value), 0, 1, self._driver.writeBlock, address, commandCode, value)
+
+    def __i2c_rdwr__(self, address, write_message, read_nbytes):
+        mem_address = TRACE_NO_ADDRESS
+        if len(write_message) >= 2:
+            mem_address = (write_message[0] << 8) | write_message[1]
+        return self._traced(TRACE_RDWR_CALL, address, mem_address, len(write_message), read_nbytes, 2,
+                            self._driver.__i2c_rdwr__, address, write_message, read_nbytes)
+
+    def isDeviceConnected(self, devAddr):
+        return self._traced(TRACE_CONNECTED, devAddr, TRACE_NO_ADDRESS, 0, 0, 0,
+                            self._driver.isDeviceConnected, devAddr)
+
+    # ------------------------------------------------------------------
+    # Reading the trace
+    def to_bytes(self):
+        """
+            Return the records, oldest first, as packed binary records
+            (decode them with iter_trace_records())
+
+            :rtype: bytes
+        """
+        with self._trace_lock:
+            end = self._next * _TRACE_RECORD.size
+            if self._count < self.capacity:
+                return bytes(self._buffer[:end])
+            return bytes(self._buffer[end:] + self._buffer[:end])
+
+    def records(self):
+        """
+            Return the records, oldest first
+
+            :rtype: list of TraceRecord
+        """
+        return list(iter_trace_records(self.to_bytes()))
+
+    def export_chrome_trace(self, file):
+        """
+            Write the trace as Chrome trace-event JSON, one complete event
+            per bus call on a track per I2C address
+
+            :param file: path or writable text file
+            :return: Nothing
+            :rtype: Void
+        """
+        events = []
+        for record in self.records():
+            args = {"write_bytes": record.write_bytes, "read_bytes": record.read_bytes, "messages": record.messages}
+            if record.mem_address != TRACE_NO_ADDRESS:
+                args["mem_address"] = "0x%04X" % record.mem_address
+            if record.errno:
+                args["errno"] = record.errno
+            events.append({"name": _TRACE_KIND_NAMES[record.kind] + (" (NACK)" if record.errno else ""),
+                           "cat": "i2c", "ph": "X", "pid": 0, "tid": "0x%02X" % record.i2c_address,
+                           "ts": record.start_ns / 1000, "dur": record.duration_ns / 1000, "args": args})
+        trace = {"traceEvents": events, "displayTimeUnit": "ns"}
+        if hasattr(file, "write"):
+            json.dump(trace, file)
+        else:
+            with open(file, "w") as trace_file:
+                json.dump(trace, trace_file)
+
+def replay_trace(records, i2c_driver, speed=1.0):
+    """
+        Replay trace records against a driver, usually a
+        SimulatedEEPROMDriver set up with the settings to try. Each call is
+        issued with the recorded sizes and addresses (written data is
+        zeros) at its recorded time divided by speed, or back to back if
+        speed is None. Errors are counted, not raised.
+
+        :param records: TraceRecord iterable, or bytes from TracingI2CDriver.to_bytes()
+        :param i2c_driver: driver to replay against
+        :param speed: replay speed factor, None for as fast as possible
+        :return: dictionary with "calls", "errors", "unexpected_errors"
+            (calls that failed on replay but not when recorded, or the other
+            way round) and "wall_s"
+        :rtype: dict
+    """
+    if isinstance(records, (bytes, bytearray, memoryview)):
+        records = iter_trace_records(records)
+    bus = i2c_driver.i2cbus
+    calls = errors = unexpected = 0
+    started = time.perf_counter()
+    for record in records:
+        if speed is not None:
+            delay = record.start_ns / 1e9 / speed - (time.perf_counter() - started)
+            if delay > 0:
+                time.sleep(delay)
+
+        address_bytes = b""
+        if record.mem_address != TRACE_NO_ADDRESS:
+            address_bytes = bytes(((record.mem_address >> 8) & 0xFF, record.mem_address & 0xFF))
+        error = 0
+        try:
+            if record.kind == TRACE_QUICK:
+                bus.write_quick(record.i2c_address)
+            elif record.kind == TRACE_CONNECTED:
+                if not i2c_driver.isDeviceConnected(record.i2c_address):
+                    error = errno.ENXIO
+            elif record.kind == TRACE_PROBE:
+                bus.i2c_rdwr(*[smbus2.i2c_msg(addr=record.i2c_address, flags=0, len=0, buf=None)
+                               for _ in range(max(record.messages, 1))])
+            else:
+                msgs = []
+                if record.write_bytes:
+                    payload = (address_bytes + bytes(record.write_bytes))[:record.write_bytes]
+                    msgs.append(smbus2.i2c_msg.write(record.i2c_address, payload))
+                read_msgs = max(record.messages - len(msgs), 1)
+                segment = -(-record.read_bytes // read_msgs) if record.read_bytes else 0
+                remaining = record.read_bytes
+                while remaining > 0:
+                    msgs.append(smbus2.i2c_msg.read(record.i2c_address, min(segment, remaining)))
+                    remaining = remaining - segment
+                bus.i2c_rdwr(*msgs)
+        except (IOError, OSError) as err:
+            error = err.errno or 0xFF
+        calls = calls + 1
+        if error:
+            errors = errors + 1
+        if bool(error) != bool(record.errno):
+            unexpected = unexpected + 1
+    return {"calls": calls, "errors": errors, "unexpected_errors": unexpected,
+            "wall_s": time.perf_counter() - started}
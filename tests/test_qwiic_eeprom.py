@@ -0,0 +1,719 @@
+# ----------------------------------------------------------------------
+# test_qwiic_eeprom.py
+#
+# Regression tests for qwiic_eeprom, run against the simulated EEPROM bus
+# ----------------------------------------------------------------------
+
+import array
+import asyncio
+import errno
+import gzip
+import io
+import json
+import os
+import pickle
+import shutil
+import struct
+import subprocess
+import sys
+import threading
+import unittest
+
+# Test the qwiic_eeprom.py next to this directory, not an installed copy
+_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, _ROOT)
+import qwiic_eeprom
+import qwiic_eeprom_sim
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+def make_eeprom(**kwargs):
+    kwargs.setdefault("write_time_ms", 1)
+    kwargs.setdefault("realtime", False)
+    driver = qwiic_eeprom_sim.SimulatedEEPROMDriver(**kwargs)
+    eeprom = qwiic_eeprom.QwiicEEPROM(i2c_driver=driver)
+    eeprom.set_page_write_time(kwargs["write_time_ms"])
+    return eeprom, driver
+
+class WriteCompleteTest(unittest.TestCase):
+
+    def test_connected_during_write_cycle(self):
+        for mode in (qwiic_eeprom.QwiicEEPROM.WRITE_COMPLETE_POLL,
+                     qwiic_eeprom.QwiicEEPROM.WRITE_COMPLETE_DELAY,
+                     qwiic_eeprom.QwiicEEPROM.WRITE_COMPLETE_ADAPTIVE):
+            eeprom, driver = make_eeprom(write_time_ms=5)
+            eeprom.set_write_complete_mode(mode)
+            eeprom.write_byte(0, 1)
+            self.assertTrue(eeprom.is_connected())
+            eeprom.write_byte(0, 2)
+            self.assertTrue(eeprom.begin())
+
+    def test_not_connected(self):
+        eeprom, driver = make_eeprom(address=0x51)
+        self.assertFalse(eeprom.is_connected())
+
+class SkipUnchangedWritesTest(unittest.TestCase):
+
+    def test_unchanged_data_is_not_programmed(self):
+        eeprom, driver = make_eeprom()
+        eeprom.enable_skip_unchanged_writes()
+        eeprom.write(0, bytes(range(128)))
+        cycles = driver.write_cycles
+        eeprom.write(0, bytes(range(128)))
+        self.assertEqual(driver.write_cycles, cycles)
+
+    def test_only_the_changed_span_is_programmed(self):
+        eeprom, driver = make_eeprom()
+        eeprom.enable_skip_unchanged_writes()
+        data = bytearray(range(256))
+        eeprom.write(0, data)
+        data[10] = 0
+        data[20] = 0
+        data[200] = 0
+        driver.reset_stats()
+        eeprom.write(0, data)
+        # One read of the old data, then one write per changed page covering only
+        # the changed span: 11 bytes of the first page, 1 of the second
+        self.assertEqual(driver.write_cycles, 2)
+        self.assertEqual(driver.bytes_written, 2 + (2 + 11) + (2 + 1))
+        self.assertEqual(eeprom.read_bytes(0, 256), data)
+
+    def test_disabled_programs_everything(self):
+        eeprom, driver = make_eeprom()
+        eeprom.write(0, bytes(range(128)))
+        eeprom.write(0, bytes(range(128)))
+        self.assertEqual(driver.write_cycles, 2)
+
+class WriteCacheTest(unittest.TestCase):
+
+    def test_writes_to_a_page_are_coalesced(self):
+        eeprom, driver = make_eeprom()
+        eeprom.enable_write_cache()
+        for location in range(0, 128, 4):
+            eeprom.write_int(location, location)
+        self.assertEqual(driver.write_cycles, 0)
+        # Reads see the cached data before it is programmed
+        self.assertEqual(eeprom.read_int(8), 8)
+        eeprom.flush()
+        self.assertEqual(driver.write_cycles, 1)
+        self.assertEqual(eeprom.read_int(124), 124)
+
+    def test_gaps_are_filled_from_the_eeprom(self):
+        eeprom, driver = make_eeprom()
+        driver.memory[0:128] = bytes(range(128))
+        eeprom.enable_write_cache()
+        eeprom.write(10, b"ab")
+        eeprom.write(20, b"cd")
+        eeprom.flush()
+        expected = bytearray(range(128))
+        expected[10:12] = b"ab"
+        expected[20:22] = b"cd"
+        self.assertEqual(driver.write_cycles, 1)
+        self.assertEqual(bytes(driver.memory[0:128]), expected)
+
+    def test_least_recently_used_page_is_evicted(self):
+        eeprom, driver = make_eeprom()
+        eeprom.enable_write_cache(max_pages=2)
+        eeprom.write(0, b"page 0")
+        eeprom.write(128, b"page 1")
+        eeprom.write(5, b"!")
+        eeprom.write(256, b"page 2")
+        # Page 1 was used least recently, so it made room for page 2
+        self.assertEqual(driver.write_cycles, 1)
+        self.assertEqual(bytes(driver.memory[128:134]), b"page 1")
+        self.assertEqual(bytes(driver.memory[0:6]), b"\xff" * 6)
+        eeprom.flush()
+        self.assertEqual(bytes(driver.memory[0:6]), b"page !")
+        self.assertEqual(driver.write_cycles, 3)
+
+    def test_context_manager_flushes(self):
+        eeprom, driver = make_eeprom()
+        eeprom.enable_write_cache()
+        with eeprom:
+            eeprom.write(0, b"data")
+        self.assertEqual(bytes(driver.memory[0:4]), b"data")
+
+    def test_disable_flushes(self):
+        eeprom, driver = make_eeprom()
+        eeprom.enable_write_cache()
+        eeprom.write(300, b"data")
+        eeprom.disable_write_cache()
+        self.assertEqual(bytes(driver.memory[300:304]), b"data")
+
+class EraseTest(unittest.TestCase):
+
+    def test_full_erase_one_write_per_page(self):
+        eeprom, driver = make_eeprom(memory_size=4096, page_size=32)
+        eeprom.set_memory_size(4096)
+        eeprom.set_page_size(32)
+        eeprom.erase(0x00)
+        self.assertEqual(bytes(driver.memory), bytes(4096))
+        self.assertEqual(driver.write_cycles, 4096 // 32)
+
+    def test_range(self):
+        eeprom, driver = make_eeprom()
+        eeprom.erase(0xAA, 100, 300)
+        self.assertEqual(bytes(driver.memory[100:300]), b"\xaa" * 200)
+        self.assertEqual(driver.memory[99], 0xFF)
+        self.assertEqual(driver.memory[300], 0xFF)
+        # Partial first and last pages, and one full page
+        self.assertEqual(driver.write_cycles, 3)
+
+    def test_skip_blank(self):
+        eeprom, driver = make_eeprom()
+        eeprom.write(1000, b"x")
+        driver.reset_stats()
+        eeprom.erase(0xFF, skip_blank=True)
+        self.assertEqual(driver.write_cycles, 1)
+        self.assertEqual(bytes(driver.memory), b"\xff" * 65536)
+
+    def test_flushes_cached_writes_first(self):
+        eeprom, driver = make_eeprom()
+        eeprom.enable_write_cache()
+        eeprom.write(0, b"stale")
+        eeprom.erase(0x00, 0, 128)
+        eeprom.flush()
+        self.assertEqual(bytes(driver.memory[0:5]), bytes(5))
+
+class TransferLimitTest(unittest.TestCase):
+
+    def test_single_read_message_adapter_keeps_write_limit(self):
+        # Adapters like i2c-bcm2835 take one read message per transfer
+        eeprom, driver = make_eeprom(max_msgs=2)
+        self.assertEqual(eeprom.read_bytes(0, 65536), b"\xff" * 65536)
+        self.assertEqual(eeprom.get_max_transfer_size(), qwiic_eeprom._I2C_RDWR_MAX_MSG_LEN)
+
+        driver.reset_stats()
+        eeprom.write(0, bytes(range(128)))
+        eeprom.flush()
+        self.assertEqual(driver.transfers - driver.probes, 1)
+        self.assertEqual(eeprom.read_bytes(0, 128), bytes(range(128)))
+
+    def test_short_message_adapter(self):
+        eeprom, driver = make_eeprom(max_transfer=32)
+        eeprom.write(0, bytes(range(256)))
+        self.assertEqual(eeprom.read_bytes(0, 256), bytes(range(256)))
+
+class BlockSelectTest(unittest.TestCase):
+
+    def test_across_block_boundary(self):
+        eeprom, driver = make_eeprom(memory_size=131072, page_size=128)
+        eeprom.set_memory_size(131072)
+        data = bytes(range(256)) * 2
+        eeprom.write(0xFFFF - 255, data)
+        self.assertEqual(bytes(driver.memory[0xFFFF - 255:0xFFFF - 255 + 512]), data)
+        self.assertEqual(eeprom.read_bytes(0xFFFF - 255, 512), data)
+        # The upper block is reached through the block select bit of the I2C address
+        self.assertEqual(eeprom.read_bytes(0x10000, 4), data[256:260])
+
+    def test_block_select_bit(self):
+        eeprom, driver = make_eeprom(memory_size=131072, block_select_shift=0)
+        eeprom.set_memory_size(131072)
+        eeprom.set_block_select_bit(0)
+        eeprom.write(0x1FFF0, b"top")
+        self.assertEqual(bytes(driver.memory[0x1FFF0:0x1FFF3]), b"top")
+        self.assertEqual(eeprom.read_bytes(0x1FFF0, 3), b"top")
+
+    def test_small_part_never_selects_a_block(self):
+        eeprom, driver = make_eeprom()
+        driver.memory[65530:65536] = b"ending"
+        self.assertEqual(eeprom.read_bytes(65530, 20), b"ending")
+        self.assertEqual(eeprom.read_bytes(65536, 4), b"")
+        self.assertEqual(eeprom.read_into(65534, bytearray(8)), 2)
+        self.assertEqual(driver.nacks, 0)
+
+    def test_negative_location(self):
+        eeprom, driver = make_eeprom()
+        with self.assertRaises(ValueError):
+            eeprom.read_bytes(-1, 4)
+
+class ReadCacheTest(unittest.TestCase):
+
+    def test_hits_and_misses(self):
+        eeprom, driver = make_eeprom()
+        driver.memory[0:512] = bytes(range(256)) * 2
+        eeprom.enable_read_cache(1024)
+        self.assertEqual(eeprom.read_bytes(100, 200), (bytes(range(256)) * 2)[100:300])
+        self.assertEqual(eeprom.get_read_cache_stats(), {"hits": 0, "misses": 3, "pages": 3})
+
+        transfers = driver.transfers
+        self.assertEqual(eeprom.read_bytes(0, 384), (bytes(range(256)) * 2)[0:384])
+        self.assertEqual(driver.transfers, transfers)
+        self.assertEqual(eeprom.get_read_cache_stats(), {"hits": 3, "misses": 3, "pages": 3})
+
+    def test_writes_update_cache(self):
+        eeprom, driver = make_eeprom()
+        eeprom.enable_read_cache()
+        eeprom.read_bytes(0, 128)
+        eeprom.write(10, b"new")
+        self.assertEqual(eeprom.read_bytes(8, 7), b"\xff\xffnew\xff\xff")
+
+    def test_eviction(self):
+        eeprom, driver = make_eeprom()
+        eeprom.enable_read_cache(256)
+        eeprom.read_bytes(0, 512)
+        self.assertEqual(eeprom.get_read_cache_stats()["pages"], 2)
+
+    def test_past_the_end_same_as_uncached(self):
+        eeprom, driver = make_eeprom()
+        driver.memory[65530:65536] = b"ending"
+        eeprom.enable_read_cache()
+        self.assertEqual(eeprom.read_bytes(65530, 20), b"ending")
+        with self.assertRaises(ValueError):
+            eeprom._read_stored_into(65530, memoryview(bytearray(20)))
+
+    def test_memory_size_change_clears_cache(self):
+        eeprom, driver = make_eeprom()
+        driver.memory[0:128] = bytes(range(128))
+        eeprom.enable_read_cache()
+        eeprom.set_memory_size(100)
+        self.assertEqual(eeprom.read_bytes(0, 128), bytes(range(100)))
+        eeprom.set_memory_size(65536)
+        self.assertEqual(eeprom.read_bytes(100, 10), bytes(range(100, 110)))
+
+class ArrayTest(unittest.TestCase):
+
+    def test_round_trip_every_type(self):
+        eeprom, driver = make_eeprom()
+        for dtype in ("int8", "uint8", "int16", "uint16", "int32", "uint32", "int64", "uint64"):
+            for byteorder in ("little", "big"):
+                typecode = qwiic_eeprom._TYPE_CODES[dtype]
+                size = array.array(typecode).itemsize
+                values = [(value * 37) % (1 << (8 * size - 1)) for value in range(50)]
+                eeprom.write_array(100, values, dtype, byteorder)
+                self.assertEqual(eeprom.read_array(100, dtype, 50, byteorder).tolist(), values)
+                self.assertEqual(bytes(driver.memory[100:100 + size]),
+                                 values[0].to_bytes(size, byteorder))
+
+    def test_floats(self):
+        eeprom, driver = make_eeprom()
+        values = [0.5, -1.25, 1e10, -3.75]
+        eeprom.write_array(0, values, "float64", "big")
+        self.assertEqual(eeprom.read_array(0, "float64", 4, "big").tolist(), values)
+        eeprom.write_array(64, array.array("f", values))
+        self.assertEqual(eeprom.read_array(64, "float32", 4).tolist(), values)
+
+    def test_one_transfer_per_page(self):
+        eeprom, driver = make_eeprom()
+        eeprom.write_array(0, range(64), "uint32")
+        eeprom.flush()
+        driver.reset_stats()
+        self.assertEqual(eeprom.read_array(0, "uint32", 64).tolist(), list(range(64)))
+        self.assertEqual(driver.transfers, 1)
+
+    def test_bad_arguments(self):
+        eeprom, driver = make_eeprom()
+        with self.assertRaises(ValueError):
+            eeprom.read_array(0, "int32", 4, "middle")
+        with self.assertRaises(ValueError):
+            eeprom.read_array(0, "complex", 4)
+
+    @unittest.skipIf(numpy is None, "NumPy isn't installed")
+    def test_numpy(self):
+        eeprom, driver = make_eeprom()
+        values = numpy.arange(20, dtype=">i2")
+        eeprom.write_array(0, values, byteorder="little")
+        self.assertEqual(numpy.frombuffer(eeprom.read_array(0, numpy.int16, 20), "<i2").tolist(), list(range(20)))
+
+class EEPROMViewTest(unittest.TestCase):
+
+    def make_view(self):
+        eeprom, driver = make_eeprom()
+        reference = bytearray(range(256)) * 2
+        driver.memory[1000:1512] = reference
+        return qwiic_eeprom.EEPROMView(eeprom, 1000, 512), reference, driver
+
+    def test_indexing_and_slicing(self):
+        view, reference, driver = self.make_view()
+        self.assertEqual(len(view), 512)
+        self.assertEqual(view[5], reference[5])
+        self.assertEqual(view[-1], reference[-1])
+        for index in (slice(10, 20), slice(None, None, 7), slice(300, 10, -3), slice(-50, None), slice(20, 10)):
+            self.assertEqual(view[index], bytes(reference[index]))
+        with self.assertRaises(IndexError):
+            view[512]
+
+    def test_slice_assignment(self):
+        view, reference, driver = self.make_view()
+        for index, data in ((slice(10, 14), b"abcd"), (3, 0x55), (-2, 0x66),
+                            (slice(100, 140, 5), b"12345678"), (slice(400, 300, -10), b"ABCDEFGHIJ")):
+            view[index] = data
+            reference[index] = data
+            self.assertEqual(view.tobytes(), bytes(reference))
+        self.assertEqual(bytes(driver.memory[1000:1512]), bytes(reference))
+
+    def test_extended_slice_is_one_span_write(self):
+        view, reference, driver = self.make_view()
+        driver.reset_stats()
+        view[24:120:8] = bytes(12)
+        # The span 24..112 lies in one page, so one read and one write
+        self.assertEqual(driver.write_cycles, 1)
+        with self.assertRaises(IndexError):
+            view[0:10:2] = b"abc"
+
+    def test_chunks_and_iteration(self):
+        view, reference, driver = self.make_view()
+        chunks = list(view.chunks(128))
+        self.assertEqual(b"".join(chunks), bytes(reference))
+        # Chunks after the first start on a 128 byte boundary of EEPROM addresses
+        self.assertEqual(len(chunks[0]), 128 - 1000 % 128)
+        self.assertEqual(list(view), list(reference))
+
+    def test_read_into(self):
+        view, reference, driver = self.make_view()
+        buffer = bytearray(16)
+        self.assertEqual(view.read_into(100, buffer), 16)
+        self.assertEqual(buffer, reference[100:116])
+        with self.assertRaises(IndexError):
+            view.read_into(500, buffer)
+
+    def test_outside_the_eeprom(self):
+        eeprom, driver = make_eeprom()
+        with self.assertRaises(ValueError):
+            qwiic_eeprom.EEPROMView(eeprom, 65000, 1000)
+
+    @unittest.skipIf(sys.version_info < (3, 12), "the Python buffer protocol needs 3.12")
+    def test_memoryview_snapshot(self):
+        view, reference, driver = self.make_view()
+        self.assertEqual(memoryview(view).tobytes(), bytes(reference))
+
+class OpenTest(unittest.TestCase):
+
+    def test_pickle_round_trip(self):
+        eeprom, driver = make_eeprom()
+        settings = {"name": "sensor", "gains": [1.5, 2.25], "enabled": True}
+        with eeprom.open("wb", start=256, length=1024) as stream:
+            pickle.dump(settings, stream)
+        with eeprom.open("rb", start=256, length=1024) as stream:
+            self.assertEqual(pickle.load(stream), settings)
+
+    def test_length_header_round_trip(self):
+        eeprom, driver = make_eeprom()
+        settings = {"samples": list(range(200))}
+        blob = gzip.compress(json.dumps(settings).encode())
+        with eeprom.open("wb") as stream:
+            stream.write(struct.pack(">I", len(blob)) + blob)
+        with eeprom.open("rb") as stream:
+            size = struct.unpack(">I", stream.read(4))[0]
+            self.assertEqual(json.loads(gzip.decompress(stream.read(size))), settings)
+
+    def test_buffered_writes_are_full_pages(self):
+        eeprom, driver = make_eeprom()
+        data = bytes(range(256)) * 16
+        with eeprom.open("wb", start=0, length=8192) as stream:
+            shutil.copyfileobj(io.BytesIO(data), stream, 100)
+        self.assertEqual(driver.write_cycles, len(data) // 128)
+        target = io.BytesIO()
+        with eeprom.open("rb", start=0, length=len(data)) as stream:
+            shutil.copyfileobj(stream, target)
+        self.assertEqual(target.getvalue(), data)
+
+    def test_region_end(self):
+        eeprom, driver = make_eeprom()
+        stream = eeprom.open("r+b", buffering=0, start=100, length=10)
+        self.assertEqual(stream.write(b"0123456789ABC"), 10)
+        with self.assertRaises(OSError) as raised:
+            stream.write(b"D")
+        self.assertEqual(raised.exception.errno, errno.ENOSPC)
+        self.assertEqual(stream.seek(-4, io.SEEK_END), 6)
+        self.assertEqual(stream.read(), b"6789")
+        self.assertEqual(stream.tell(), 10)
+        stream.close()
+        self.assertEqual(bytes(driver.memory[100:111]), b"0123456789\xff")
+
+    def test_bad_arguments(self):
+        eeprom, driver = make_eeprom()
+        with self.assertRaises(ValueError):
+            eeprom.open("rw")
+        with self.assertRaises(ValueError):
+            eeprom.open("rb", start=65000, length=1000)
+        with self.assertRaises(io.UnsupportedOperation):
+            eeprom.open("rb").write(b"x")
+
+class TracingTest(unittest.TestCase):
+
+    def make_tracer(self, capacity=1000):
+        driver = qwiic_eeprom_sim.SimulatedEEPROMDriver(write_time_ms=1, realtime=False)
+        tracer = qwiic_eeprom_sim.TracingI2CDriver(driver, capacity=capacity)
+        eeprom = qwiic_eeprom.QwiicEEPROM(i2c_driver=tracer)
+        eeprom.set_page_write_time(1)
+        return eeprom, tracer, driver
+
+    def test_records(self):
+        eeprom, tracer, driver = self.make_tracer()
+        eeprom.write(10, bytes(500))
+        eeprom.read_bytes(0, 3000)
+        records = tracer.records()
+        self.assertEqual(len(records), driver.transfers)
+        writes = [record for record in records if record.kind == qwiic_eeprom_sim.TRACE_WRITE]
+        # The first write runs to the end of the first page
+        self.assertEqual((writes[0].mem_address, writes[0].write_bytes), (10, 2 + 118))
+        reads = [record for record in records if record.kind == qwiic_eeprom_sim.TRACE_READ]
+        self.assertEqual((reads[0].mem_address, reads[0].read_bytes), (0, 3000))
+        self.assertEqual(list(qwiic_eeprom_sim.iter_trace_records(tracer.to_bytes())), records)
+
+    def test_ring_buffer_keeps_the_newest(self):
+        eeprom, tracer, driver = self.make_tracer(capacity=5)
+        for location in range(12):
+            eeprom.read_byte(location)
+        self.assertEqual([record.mem_address for record in tracer.records()], [7, 8, 9, 10, 11])
+        self.assertEqual(tracer.dropped, 7)
+        tracer.clear()
+        self.assertEqual(len(tracer), 0)
+
+    def test_chrome_trace_export(self):
+        eeprom, tracer, driver = self.make_tracer()
+        eeprom.write(0, b"hello")
+        eeprom.read_bytes(0, 5)
+        output = io.StringIO()
+        tracer.export_chrome_trace(output)
+        events = json.loads(output.getvalue())["traceEvents"]
+        self.assertEqual(len(events), len(tracer))
+        self.assertEqual(events[0]["ph"], "X")
+        self.assertEqual(events[0]["tid"], "0x50")
+        self.assertEqual(events[0]["args"]["mem_address"], "0x0000")
+
+    def test_replay(self):
+        eeprom, tracer, driver = self.make_tracer()
+        eeprom.write(0, bytes(range(256)))
+        eeprom.flush()
+        eeprom.read_bytes(0, 256)
+        records = tracer.records()
+        # Back to back against a part with no write cycle time: every call succeeds,
+        # so only the ACK-polls NACKed while recording differ
+        target = qwiic_eeprom_sim.SimulatedEEPROMDriver(write_time_ms=0, realtime=False)
+        result = qwiic_eeprom_sim.replay_trace(tracer.to_bytes(), target, speed=None)
+        self.assertEqual(result["calls"], len(records))
+        self.assertEqual(result["errors"], 0)
+        self.assertEqual(result["unexpected_errors"], sum(1 for record in records if record.errno))
+        self.assertEqual(target.write_cycles, driver.write_cycles)
+        self.assertEqual(target.bytes_read, 256)
+
+class ReadvTest(unittest.TestCase):
+
+    def test_results_in_request_order(self):
+        eeprom, driver = make_eeprom()
+        driver.memory[0:4096] = bytes(range(256)) * 16
+        requests = [(3000, 4), (0, 4), (64, 16), (8, 4), (70, 2), (1000, 10), (3010, 4)]
+        driver.reset_stats()
+        results = eeprom.readv(requests)
+        self.assertEqual([bytes(result) for result in results],
+                         [bytes(driver.memory[location:location + length]) for location, length in requests])
+        # Merged into [0, 12), [64, 80), [1000, 1010) and [3000, 3014)
+        self.assertEqual(driver.transfers, 4)
+        self.assertEqual(driver.bytes_read, 12 + 16 + 10 + 14)
+
+    def test_max_gap(self):
+        eeprom, driver = make_eeprom()
+        driver.reset_stats()
+        eeprom.readv([(0, 4), (100, 4)], max_gap=0)
+        self.assertEqual(driver.transfers, 2)
+        driver.reset_stats()
+        eeprom.readv([(0, 4), (100, 4)], max_gap=96)
+        self.assertEqual(driver.transfers, 1)
+
+    def test_sees_cached_writes(self):
+        eeprom, driver = make_eeprom()
+        eeprom.enable_write_cache()
+        eeprom.write(10, b"cached")
+        self.assertEqual(bytes(eeprom.readv([(10, 6)])[0]), b"cached")
+
+    def test_past_the_end_comes_back_short(self):
+        eeprom, driver = make_eeprom()
+        self.assertEqual([bytes(result) for result in eeprom.readv([(65530, 10), (65520, 4)])],
+                         [b"\xff" * 6, b"\xff" * 4])
+        with self.assertRaises(ValueError):
+            eeprom.readv([(-1, 4)])
+
+class DeviceProfileTest(unittest.TestCase):
+
+    def test_detect_each_profile(self):
+        for part, profile in sorted(qwiic_eeprom._DEVICE_PROFILES.items()):
+            eeprom, driver = make_eeprom(memory_size=profile["memory_size_bytes"],
+                                         page_size=profile["page_size_bytes"],
+                                         block_select_shift=profile["block_select_shift"])
+            driver.memory[0:8] = b"contents"
+            qwiic_eeprom._detected_profiles.clear()
+            detected = eeprom.detect()
+            self.assertEqual(detected["part"], part)
+            self.assertEqual(eeprom.get_memory_size(), profile["memory_size_bytes"])
+            self.assertEqual(eeprom.get_page_size(), profile["page_size_bytes"])
+            self.assertEqual(eeprom.get_block_select_bit(), profile["block_select_shift"])
+            # Bytes changed while probing are put back
+            self.assertEqual(bytes(driver.memory[0:8]), b"contents")
+            self.assertEqual(bytes(driver.memory[8:]), b"\xff" * (len(driver.memory) - 8))
+
+    def test_detect_is_cached(self):
+        eeprom, driver = make_eeprom()
+        qwiic_eeprom._detected_profiles.clear()
+        eeprom.detect()
+        driver.reset_stats()
+        self.assertEqual(eeprom.detect()["part"], "24xx512")
+        self.assertEqual(driver.transfers, 0)
+
+    def test_set_device_profile(self):
+        eeprom, driver = make_eeprom()
+        self.assertIn("24xx1025", eeprom.get_device_profiles())
+        eeprom.set_device_profile("24xx1025")
+        self.assertEqual(eeprom.get_memory_size(), 131072)
+        self.assertEqual(eeprom.get_page_size(), 128)
+        self.assertEqual(eeprom.get_block_select_bit(), 2)
+        with self.assertRaises(ValueError):
+            eeprom.set_device_profile("24xx9999")
+
+class QwiicEEPROMArrayTest(unittest.TestCase):
+
+    def make_array(self, layout, chips=4):
+        drivers = [qwiic_eeprom_sim.SimulatedEEPROMDriver(memory_size=4096, page_size=32, write_time_ms=1,
+                                                          address=0x50 + chip, realtime=False)
+                   for chip in range(chips)]
+        eeproms = []
+        for chip, driver in enumerate(drivers):
+            eeprom = qwiic_eeprom.QwiicEEPROM(0x50 + chip, driver)
+            eeprom.set_memory_size(4096)
+            eeprom.set_page_size(32)
+            eeprom.set_page_write_time(1)
+            eeproms.append(eeprom)
+        return qwiic_eeprom.QwiicEEPROMArray(eeproms, layout=layout), drivers
+
+    def test_striped_write_spreads_pages(self):
+        array, drivers = self.make_array(qwiic_eeprom.QwiicEEPROMArray.STRIPE)
+        self.assertEqual(array.length(), 4 * 4096)
+        data = bytes(range(256)) * 2
+        array.write(16, data)
+        array.flush()
+        self.assertEqual(array.read_bytes(16, 512), data)
+        # Array page n is page n // 4 of chip n % 4
+        for page in range(17):
+            chip, chip_page = page % 4, page // 4
+            start = max(page * 32, 16)
+            end = min(page * 32 + 32, 16 + 512)
+            chip_start = chip_page * 32 + start - page * 32
+            self.assertEqual(bytes(drivers[chip].memory[chip_start:chip_start + end - start]), data[start - 16:end - 16])
+        self.assertEqual(sum(driver.write_cycles for driver in drivers), 17)
+        self.assertEqual([driver.write_cycles for driver in drivers], [5, 4, 4, 4])
+
+    def test_concatenated_write_crosses_chips(self):
+        array, drivers = self.make_array(qwiic_eeprom.QwiicEEPROMArray.CONCATENATE, chips=2)
+        array.write(4090, b"0123456789AB")
+        array.flush()
+        self.assertEqual(bytes(drivers[0].memory[4090:4096]), b"012345")
+        self.assertEqual(bytes(drivers[1].memory[0:6]), b"6789AB")
+        self.assertEqual(array.read_bytes(4090, 12), b"0123456789AB")
+
+    def test_erase(self):
+        array, drivers = self.make_array(qwiic_eeprom.QwiicEEPROMArray.STRIPE, chips=2)
+        array.erase(0x00, 0, 256)
+        array.flush()
+        self.assertEqual(array.read_bytes(0, 256), bytes(256))
+        self.assertEqual(array.read_bytes(256, 4), b"\xff" * 4)
+
+    def test_stripe_needs_one_page_size(self):
+        array, drivers = self.make_array(qwiic_eeprom.QwiicEEPROMArray.STRIPE, chips=2)
+        array.eeproms[1].set_page_size(64)
+        with self.assertRaises(ValueError):
+            qwiic_eeprom.QwiicEEPROMArray(array.eeproms)
+
+class ThreadSafetyTest(unittest.TestCase):
+
+    def test_concurrent_writes_and_reads(self):
+        eeprom, driver = make_eeprom()
+        eeprom.enable_thread_safety()
+        errors = []
+
+        def worker(number):
+            try:
+                data = bytes((number,)) * 300
+                location = number * 1000
+                for repeat in range(5):
+                    eeprom.write(location, data)
+                    if eeprom.read_bytes(location, 300) != data:
+                        errors.append(number)
+            except Exception as err:
+                errors.append(err)
+
+        threads = [threading.Thread(target=worker, args=(number,)) for number in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        for number in range(8):
+            self.assertEqual(bytes(driver.memory[number * 1000:number * 1000 + 300]), bytes((number,)) * 300)
+
+    def test_eeproms_on_one_bus_share_the_bus_lock(self):
+        eeprom, driver = make_eeprom()
+        other = qwiic_eeprom.QwiicEEPROM(0x51, driver)
+        eeprom.enable_thread_safety()
+        other.enable_thread_safety()
+        self.assertIs(eeprom._bus_lock, other._bus_lock)
+        self.assertIs(eeprom._bus_lock, qwiic_eeprom.get_bus_lock(driver))
+        self.assertIsNot(eeprom._lock, other._lock)
+
+    def test_disable(self):
+        eeprom, driver = make_eeprom()
+        eeprom.enable_thread_safety()
+        eeprom.disable_thread_safety()
+        self.assertIsNone(eeprom._lock)
+        self.assertIsNone(eeprom._bus_lock)
+
+class WriteQueueTest(unittest.TestCase):
+
+    def test_skip_unchanged_writes_programs_queued_data(self):
+        eeprom, driver = make_eeprom()
+        eeprom.enable_skip_unchanged_writes()
+        eeprom.enable_write_queue()
+        try:
+            eeprom.write(1000, b"hello")
+            eeprom.wait()
+            self.assertEqual(bytes(driver.memory[1000:1005]), b"hello")
+
+            # Unchanged data is still skipped
+            cycles = driver.write_cycles
+            eeprom.write(1000, b"hello")
+            eeprom.wait()
+            self.assertEqual(driver.write_cycles, cycles)
+        finally:
+            eeprom.disable_write_queue()
+
+    def test_skip_unchanged_writes_programs_cached_data(self):
+        eeprom, driver = make_eeprom()
+        eeprom.enable_skip_unchanged_writes()
+        eeprom.enable_write_cache()
+        eeprom.write(1000, b"hello")
+        eeprom.flush()
+        self.assertEqual(bytes(driver.memory[1000:1005]), b"hello")
+
+    def test_queue_drained_at_exit(self):
+        script = (
+            "import atexit, qwiic_eeprom, qwiic_eeprom_sim\n"
+            "driver = qwiic_eeprom_sim.SimulatedEEPROMDriver(write_time_ms=2, realtime=False)\n"
+            "atexit.register(lambda: print(bytes(driver.memory[:4096]) == bytes(range(256)) * 16))\n"
+            "eeprom = qwiic_eeprom.QwiicEEPROM(i2c_driver=driver)\n"
+            "eeprom.enable_write_queue()\n"
+            "eeprom.write(0, bytes(range(256)) * 16)\n")
+        output = subprocess.check_output([sys.executable, "-c", script], cwd=_ROOT)
+        self.assertEqual(output.strip(), b"True")
+
+class AsyncQwiicEEPROMTest(unittest.TestCase):
+
+    def test_context_exit_drains_write_queue(self):
+        eeprom, driver = make_eeprom(write_time_ms=10)
+        eeprom.enable_write_queue()
+
+        async def write_pages():
+            async with qwiic_eeprom.AsyncQwiicEEPROM(eeprom):
+                # Queued straight away, programmed by the writer thread
+                eeprom.write(0, bytes(range(256)) * 8)
+            return bytes(driver.memory[0:2048])
+
+        try:
+            self.assertEqual(asyncio.run(write_pages()), bytes(range(256)) * 8)
+        finally:
+            eeprom.disable_write_queue()
+
+if __name__ == '__main__':
+    unittest.main()